@@ -0,0 +1,270 @@
+"""
+Authenticode verification — checks executable signatures in-process via WinVerifyTrust.
+Handles both embedded signatures and catalog-signed system files.
+"""
+
+import ctypes
+import msvcrt
+from ctypes import wintypes
+from typing import Optional
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+class _WINTRUST_FILE_INFO(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("pcwszFilePath", wintypes.LPCWSTR),
+        ("hFile", wintypes.HANDLE),
+        ("pgKnownSubject", ctypes.POINTER(_GUID)),
+    ]
+
+
+class _WINTRUST_CATALOG_INFO(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("dwCatalogVersion", wintypes.DWORD),
+        ("pcwszCatalogFilePath", wintypes.LPCWSTR),
+        ("pcwszMemberTag", wintypes.LPCWSTR),
+        ("pcwszMemberFilePath", wintypes.LPCWSTR),
+        ("hMemberFile", wintypes.HANDLE),
+        ("pbCalculatedFileHash", ctypes.POINTER(ctypes.c_ubyte)),
+        ("cbCalculatedFileHash", wintypes.DWORD),
+        ("pcCatalogContext", ctypes.c_void_p),
+        ("hCatAdmin", wintypes.HANDLE),
+    ]
+
+
+class _WINTRUST_DATA(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("pPolicyCallbackData", ctypes.c_void_p),
+        ("pSIPClientData", ctypes.c_void_p),
+        ("dwUIChoice", wintypes.DWORD),
+        ("fdwRevocationChecks", wintypes.DWORD),
+        ("dwUnionChoice", wintypes.DWORD),
+        ("pInfo", ctypes.c_void_p),  # WINTRUST_FILE_INFO* or WINTRUST_CATALOG_INFO*
+        ("dwStateAction", wintypes.DWORD),
+        ("hWVTStateData", wintypes.HANDLE),
+        ("pwszURLReference", wintypes.LPWSTR),
+        ("dwProvFlags", wintypes.DWORD),
+        ("dwUIContext", wintypes.DWORD),
+        ("pSignatureSettings", ctypes.c_void_p),
+    ]
+
+
+class _CATALOG_INFO(ctypes.Structure):
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("wszCatalogFile", wintypes.WCHAR * 260),
+    ]
+
+
+class _CRYPT_PROVIDER_CERT(ctypes.Structure):
+    # Only the leading fields are read
+    _fields_ = [
+        ("cbStruct", wintypes.DWORD),
+        ("pCert", ctypes.c_void_p),
+    ]
+
+
+_WINTRUST_ACTION_GENERIC_VERIFY_V2 = _GUID(
+    0x00AAC56B, 0xCD44, 0x11D0,
+    (ctypes.c_ubyte * 8)(0x8C, 0xC2, 0x00, 0xC0, 0x4F, 0xC2, 0x95, 0xEE),
+)
+
+_WTD_UI_NONE = 2
+_WTD_REVOKE_NONE = 0
+_WTD_CHOICE_FILE = 1
+_WTD_CHOICE_CATALOG = 2
+_WTD_STATEACTION_VERIFY = 1
+_WTD_STATEACTION_CLOSE = 2
+_WTD_CACHE_ONLY_URL_RETRIEVAL = 0x1000
+_CERT_NAME_SIMPLE_DISPLAY_TYPE = 4
+_INVALID_HANDLE_VALUE = wintypes.HANDLE(-1)
+
+try:
+    _wintrust = ctypes.WinDLL("wintrust")
+    _crypt32 = ctypes.WinDLL("crypt32")
+
+    _wintrust.WinVerifyTrust.argtypes = [wintypes.HWND, ctypes.POINTER(_GUID), ctypes.c_void_p]
+    _wintrust.WinVerifyTrust.restype = wintypes.LONG
+    _wintrust.WTHelperProvDataFromStateData.argtypes = [wintypes.HANDLE]
+    _wintrust.WTHelperProvDataFromStateData.restype = ctypes.c_void_p
+    _wintrust.WTHelperGetProvSignerFromChain.argtypes = [
+        ctypes.c_void_p, wintypes.DWORD, wintypes.BOOL, wintypes.DWORD,
+    ]
+    _wintrust.WTHelperGetProvSignerFromChain.restype = ctypes.c_void_p
+    _wintrust.WTHelperGetProvCertFromChain.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+    _wintrust.WTHelperGetProvCertFromChain.restype = ctypes.POINTER(_CRYPT_PROVIDER_CERT)
+    _wintrust.CryptCATAdminAcquireContext.argtypes = [
+        ctypes.POINTER(wintypes.HANDLE), ctypes.POINTER(_GUID), wintypes.DWORD,
+    ]
+    _wintrust.CryptCATAdminAcquireContext.restype = wintypes.BOOL
+    _wintrust.CryptCATAdminCalcHashFromFileHandle.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD), ctypes.POINTER(ctypes.c_ubyte), wintypes.DWORD,
+    ]
+    _wintrust.CryptCATAdminCalcHashFromFileHandle.restype = wintypes.BOOL
+    _wintrust.CryptCATAdminEnumCatalogFromHash.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(ctypes.c_ubyte), wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+    ]
+    _wintrust.CryptCATAdminEnumCatalogFromHash.restype = wintypes.HANDLE
+    _wintrust.CryptCATCatalogInfoFromContext.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(_CATALOG_INFO), wintypes.DWORD,
+    ]
+    _wintrust.CryptCATCatalogInfoFromContext.restype = wintypes.BOOL
+    _wintrust.CryptCATAdminReleaseCatalogContext.argtypes = [wintypes.HANDLE, wintypes.HANDLE, wintypes.DWORD]
+    _wintrust.CryptCATAdminReleaseCatalogContext.restype = wintypes.BOOL
+    _wintrust.CryptCATAdminReleaseContext.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _wintrust.CryptCATAdminReleaseContext.restype = wintypes.BOOL
+    _crypt32.CertGetNameStringW.argtypes = [
+        ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p, wintypes.LPWSTR, wintypes.DWORD,
+    ]
+    _crypt32.CertGetNameStringW.restype = wintypes.DWORD
+
+    # SHA-256 catalog lookups (Windows 8+); older systems fall back to SHA-1
+    try:
+        _wintrust.CryptCATAdminAcquireContext2.argtypes = [
+            ctypes.POINTER(wintypes.HANDLE), ctypes.POINTER(_GUID), wintypes.LPCWSTR,
+            ctypes.c_void_p, wintypes.DWORD,
+        ]
+        _wintrust.CryptCATAdminAcquireContext2.restype = wintypes.BOOL
+        _wintrust.CryptCATAdminCalcHashFromFileHandle2.argtypes = [
+            wintypes.HANDLE, wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD),
+            ctypes.POINTER(ctypes.c_ubyte), wintypes.DWORD,
+        ]
+        _wintrust.CryptCATAdminCalcHashFromFileHandle2.restype = wintypes.BOOL
+        _HAS_SHA256_CATALOGS = True
+    except AttributeError:
+        _HAS_SHA256_CATALOGS = False
+
+    AVAILABLE = True
+except (AttributeError, OSError):
+    AVAILABLE = False
+
+
+def _signer_name(state_data) -> str:
+    """Simple display name (usually the CN) of the leaf signing certificate."""
+    prov_data = _wintrust.WTHelperProvDataFromStateData(state_data)
+    if not prov_data:
+        return ""
+    signer = _wintrust.WTHelperGetProvSignerFromChain(prov_data, 0, False, 0)
+    if not signer:
+        return ""
+    cert = _wintrust.WTHelperGetProvCertFromChain(signer, 0)
+    if not cert or not cert.contents.pCert:
+        return ""
+    buf = ctypes.create_unicode_buffer(256)
+    _crypt32.CertGetNameStringW(cert.contents.pCert, _CERT_NAME_SIMPLE_DISPLAY_TYPE, 0, None, buf, 256)
+    return buf.value
+
+
+def _win_verify(union_choice: int, info) -> tuple[bool, str]:
+    """Run WinVerifyTrust on a prepared file/catalog info struct."""
+    data = _WINTRUST_DATA()
+    data.cbStruct = ctypes.sizeof(_WINTRUST_DATA)
+    data.dwUIChoice = _WTD_UI_NONE
+    data.fdwRevocationChecks = _WTD_REVOKE_NONE
+    data.dwUnionChoice = union_choice
+    data.pInfo = ctypes.addressof(info)
+    data.dwStateAction = _WTD_STATEACTION_VERIFY
+    data.dwProvFlags = _WTD_CACHE_ONLY_URL_RETRIEVAL
+
+    action = ctypes.byref(_WINTRUST_ACTION_GENERIC_VERIFY_V2)
+    status = _wintrust.WinVerifyTrust(_INVALID_HANDLE_VALUE, action, ctypes.byref(data))
+    try:
+        if status != 0:
+            return False, ""
+        return True, _signer_name(data.hWVTStateData)
+    finally:
+        data.dwStateAction = _WTD_STATEACTION_CLOSE
+        _wintrust.WinVerifyTrust(_INVALID_HANDLE_VALUE, action, ctypes.byref(data))
+
+
+def _verify_embedded(path: str) -> tuple[bool, str]:
+    """Verify a signature embedded in the file itself."""
+    info = _WINTRUST_FILE_INFO()
+    info.cbStruct = ctypes.sizeof(_WINTRUST_FILE_INFO)
+    info.pcwszFilePath = path
+    return _win_verify(_WTD_CHOICE_FILE, info)
+
+
+def _acquire_cat_admin(sha256: bool):
+    """Open a catalog admin context, or None."""
+    handle = wintypes.HANDLE()
+    if sha256:
+        ok = _wintrust.CryptCATAdminAcquireContext2(ctypes.byref(handle), None, "SHA256", None, 0)
+    else:
+        ok = _wintrust.CryptCATAdminAcquireContext(ctypes.byref(handle), None, 0)
+    return handle if ok else None
+
+
+def _file_hash(cat_admin, file_handle, sha256: bool) -> Optional[bytes]:
+    """Hash a file the way the catalog database indexes it."""
+    size = wintypes.DWORD(64)
+    buf = (ctypes.c_ubyte * 64)()
+    if sha256:
+        ok = _wintrust.CryptCATAdminCalcHashFromFileHandle2(cat_admin, file_handle, ctypes.byref(size), buf, 0)
+    else:
+        ok = _wintrust.CryptCATAdminCalcHashFromFileHandle(file_handle, ctypes.byref(size), buf, 0)
+    return bytes(buf[:size.value]) if ok else None
+
+
+def _verify_catalog(path: str, sha256: bool) -> tuple[bool, str]:
+    """Verify a file against the system catalog database."""
+    cat_admin = _acquire_cat_admin(sha256)
+    if cat_admin is None:
+        return False, ""
+    try:
+        with open(path, "rb") as f:
+            file_hash = _file_hash(cat_admin, wintypes.HANDLE(msvcrt.get_osfhandle(f.fileno())), sha256)
+        if not file_hash:
+            return False, ""
+
+        hash_buf = (ctypes.c_ubyte * len(file_hash)).from_buffer_copy(file_hash)
+        cat_info_ctx = _wintrust.CryptCATAdminEnumCatalogFromHash(cat_admin, hash_buf, len(file_hash), 0, None)
+        if not cat_info_ctx:
+            return False, ""
+        try:
+            cat_info = _CATALOG_INFO()
+            cat_info.cbStruct = ctypes.sizeof(_CATALOG_INFO)
+            if not _wintrust.CryptCATCatalogInfoFromContext(cat_info_ctx, ctypes.byref(cat_info), 0):
+                return False, ""
+
+            info = _WINTRUST_CATALOG_INFO()
+            info.cbStruct = ctypes.sizeof(_WINTRUST_CATALOG_INFO)
+            info.pcwszCatalogFilePath = cat_info.wszCatalogFile
+            info.pcwszMemberTag = file_hash.hex().upper()
+            info.pcwszMemberFilePath = path
+            info.pbCalculatedFileHash = ctypes.cast(hash_buf, ctypes.POINTER(ctypes.c_ubyte))
+            info.cbCalculatedFileHash = len(file_hash)
+            info.hCatAdmin = cat_admin.value
+            return _win_verify(_WTD_CHOICE_CATALOG, info)
+        finally:
+            _wintrust.CryptCATAdminReleaseCatalogContext(cat_admin, cat_info_ctx, 0)
+    except OSError:
+        return False, ""
+    finally:
+        _wintrust.CryptCATAdminReleaseContext(cat_admin, 0)
+
+
+def verify_signature(path: str) -> tuple[bool, str]:
+    """
+    Verify an executable's Authenticode signature.
+    Returns (is_signed, signer_name). Thread-safe; no subprocesses.
+    """
+    result = _verify_embedded(path)
+    if result[0]:
+        return result
+    if _HAS_SHA256_CATALOGS:
+        result = _verify_catalog(path, sha256=True)
+        if result[0]:
+            return result
+    return _verify_catalog(path, sha256=False)
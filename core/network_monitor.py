@@ -2,8 +2,12 @@
 Network Activity Monitor — per-process network connections with reverse DNS and threat detection.
 """
 
+import re
 import socket
+import struct
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 from functools import lru_cache
@@ -11,7 +15,7 @@ from functools import lru_cache
 import psutil
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
     pid: int
     process_name: str
@@ -27,7 +31,7 @@ class ConnectionInfo:
 
 
 # Ports commonly associated with malware / C2 communication
-_SUSPICIOUS_PORTS = {
+_SUSPICIOUS_PORTS = frozenset({
     4444, 5555, 6666, 7777, 8888, 9999,  # Common reverse shell ports
     1234, 31337,                           # Classic backdoor ports
     3389,                                   # RDP (suspicious if unexpected)
@@ -36,15 +40,19 @@ _SUSPICIOUS_PORTS = {
     8080, 8443, 8081,                      # Alt HTTP (suspicious for non-browsers)
     6667, 6697,                            # IRC (common for C2)
     1337, 1338,                            # Hacker convention
-}
+})
 
 # Processes that legitimately use many network connections
-_LEGIT_NETWORK_PROCS = {
+_LEGIT_NETWORK_PROCS = frozenset({
     'chrome.exe', 'firefox.exe', 'msedge.exe', 'brave.exe', 'opera.exe',
     'svchost.exe', 'teams.exe', 'slack.exe', 'discord.exe', 'zoom.exe',
     'spotify.exe', 'steam.exe', 'onedrive.exe', 'dropbox.exe',
     'code.exe', 'outlook.exe', 'thunderbird.exe',
-}
+})
+
+# IRC ports and the clients expected to use them
+_IRC_PORTS = frozenset({6667, 6697})
+_IRC_CLIENTS = frozenset({'hexchat.exe', 'mirc.exe', 'irssi.exe'})
 
 # Suspicious locations for executables
 _SUSPICIOUS_PATHS = [
@@ -53,52 +61,266 @@ _SUSPICIOUS_PATHS = [
     '\\programdata\\', '\\public\\',
 ]
 
+# All suspicious locations matched in a single scan of the exe path
+_SUSPICIOUS_PATH_RE = re.compile("|".join(re.escape(p) for p in _SUSPICIOUS_PATHS))
+
+# Remote addresses that never need a reverse DNS lookup
+_NO_DNS_ADDRS = ("", "0.0.0.0", "::", "127.0.0.1", "::1")
+
+# IPv4 ranges whose PTR lookups never resolve publicly (inclusive integer bounds)
+_NO_DNS_V4_RANGES = tuple(
+    (struct.unpack("!I", socket.inet_aton(lo))[0], struct.unpack("!I", socket.inet_aton(hi))[0])
+    for lo, hi in (
+        ("0.0.0.0", "0.255.255.255"),          # "This" network
+        ("10.0.0.0", "10.255.255.255"),        # RFC 1918
+        ("100.64.0.0", "100.127.255.255"),     # CGNAT
+        ("127.0.0.0", "127.255.255.255"),      # Loopback
+        ("169.254.0.0", "169.254.255.255"),    # Link-local
+        ("172.16.0.0", "172.31.255.255"),      # RFC 1918
+        ("192.168.0.0", "192.168.255.255"),    # RFC 1918
+        ("224.0.0.0", "255.255.255.255"),      # Multicast / reserved / broadcast
+    )
+)
+
+# Concurrent reverse DNS lookups per refresh
+_DNS_WORKERS = 32
+
+# Reverse DNS cache bounds (seconds / entries)
+_DNS_CACHE_SIZE = 4096
+_DNS_TTL = 15 * 60
+_DNS_NEGATIVE_TTL = 60
+
+# How long a pid -> process name mapping is trusted (seconds)
+_NAME_TTL = 2.0
+
+# Background refresh stops after this long without a get_connections() call (seconds)
+_IDLE_TIMEOUT = 30.0
+
+# Longest a reader waits for the first snapshot before returning what it has (seconds)
+_READY_TIMEOUT = 5.0
+
+
+def _wants_dns(ip: str) -> bool:
+    """True if a reverse lookup of ip could return a useful hostname."""
+    if ip in _NO_DNS_ADDRS:
+        return False
+    if ":" in ip:
+        return True
+    try:
+        value = struct.unpack("!I", socket.inet_aton(ip))[0]
+    except OSError:
+        return False
+    for lo, hi in _NO_DNS_V4_RANGES:
+        if lo <= value <= hi:
+            return False
+    return True
+
+
+@lru_cache(maxsize=2048)
+def _get_exe(pid: int, create_time: float) -> str:
+    """Executable path of a process. Keyed by create time so a reused PID misses."""
+    try:
+        return psutil.Process(pid).exe() or ""
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return ""
+
+
+class _DnsCache:
+    """Bounded cache of reverse DNS results with per-entry expiry.
+
+    Reads are lock-free (a single dict.get is atomic under the GIL); only
+    writers take the lock. Eviction is oldest-inserted first.
+    """
+
+    def __init__(self, maxsize: int = _DNS_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ip: str) -> Optional[str]:
+        """Return the cached hostname, or None if missing or expired."""
+        entry = self._entries.get(ip)
+        if entry is None or time.monotonic() >= entry[1]:
+            return None
+        return entry[0]
+
+    def update(self, results: dict[str, str]):
+        """Cache lookup results. Failed lookups ("") expire quickly so they self-heal."""
+        now = time.monotonic()
+        with self._lock:
+            for ip, hostname in results.items():
+                self._store(ip, hostname, now)
+
+    def _store(self, ip: str, hostname: str, now: float):
+        """Insert an entry and evict the oldest ones. Caller holds the lock."""
+        ttl = _DNS_TTL if hostname else _DNS_NEGATIVE_TTL
+        # Re-insert so refreshed entries move to the back of the eviction order
+        self._entries.pop(ip, None)
+        self._entries[ip] = (hostname, now + ttl)
+        while len(self._entries) > self._maxsize:
+            del self._entries[next(iter(self._entries))]
+
 
 class NetworkMonitor:
     """Monitors per-process network connections."""
 
     def __init__(self):
-        self._dns_cache: dict[str, str] = {}
+        self._dns_cache = _DnsCache()
+        self._name_cache: dict[int, tuple[str, float]] = {}  # pid -> (name, expiry)
+        self._pool = ThreadPoolExecutor(max_workers=_DNS_WORKERS,
+                                        thread_name_prefix="dns")
+
+        # Background refresh state
+        self._snapshot: list[ConnectionInfo] = []
+        self._refresh_interval = 1.0
         self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_request = 0.0
+        self._stopped = False  # stop() is final: the DNS pool cannot be restarted
+
+    def start(self):
+        """Start the background refresh thread if it is not already running."""
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self):
+        """Body of start(); caller holds _lock."""
+        if self._stopped or (self._thread and self._thread.is_alive()):
+            return
+        self._ready.clear()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="network-monitor", daemon=True
+        )
+        self._thread.start()
 
-    def get_connections(self) -> list[ConnectionInfo]:
-        """Get all active network connections with process info."""
-        connections = []
-        proc_names = {}
-
-        # Cache process names
-        for proc in psutil.process_iter(['pid', 'name']):
+    def stop(self):
+        """Stop the background refresh thread and the DNS lookup pool for good (on shutdown)."""
+        with self._lock:
+            self._stopped = True
+        self._stop_event.set()
+        self._ready.set()  # Release readers still waiting for a first snapshot
+        thread = self._thread
+        if thread and thread.is_alive():
+            thread.join(timeout=2)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _refresh_loop(self):
+        """Keep the connection snapshot fresh so readers never wait on DNS or psutil."""
+        while not self._stop_event.is_set():
             try:
-                proc_names[proc.info['pid']] = proc.info['name'] or ""
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+                snapshot = self._collect_connections()
+            except (psutil.Error, OSError):
+                # Transient enumeration failure: keep the last snapshot and retry
+                snapshot = None
+            if snapshot is not None:
+                with self._lock:
+                    self._snapshot = snapshot
+            self._ready.set()
+
+            # Nobody is looking — let the thread exit until the next request. Decided
+            # under the lock, and _thread is cleared there, so a concurrent
+            # get_connections() either keeps this thread alive or starts a new one
+            with self._lock:
+                if time.monotonic() - self._last_request > _IDLE_TIMEOUT:
+                    self._thread = None
+                    break
+            self._stop_event.wait(self._refresh_interval)
 
-        # TCP connections
-        try:
-            for conn in psutil.net_connections(kind='tcp'):
-                if conn.pid and conn.pid > 0:
-                    ci = self._build_connection(conn, proc_names, "TCP")
-                    if ci:
-                        connections.append(ci)
-        except (psutil.AccessDenied, PermissionError):
-            pass
+    def get_connections(self) -> list[ConnectionInfo]:
+        """Get all active network connections with process info (latest snapshot)."""
+        with self._lock:
+            self._last_request = time.monotonic()
+            self._start_locked()
+        self._ready.wait(_READY_TIMEOUT)
+        with self._lock:
+            return list(self._snapshot)
+
+    def _collect_connections(self) -> list[ConnectionInfo]:
+        """Enumerate connections and resolve hostnames (runs on the refresh thread)."""
+        connections = []
+        procs: dict[int, psutil.Process] = {}  # Process handles reused for this refresh
 
-        # UDP connections
+        # TCP and UDP connections in a single table walk
         try:
-            for conn in psutil.net_connections(kind='udp'):
+            for conn in psutil.net_connections(kind='inet'):
                 if conn.pid and conn.pid > 0:
-                    ci = self._build_connection(conn, proc_names, "UDP")
+                    protocol = "TCP" if conn.type == socket.SOCK_STREAM else "UDP"
+                    ci = self._build_connection(conn, procs, protocol)
                     if ci:
                         connections.append(ci)
         except (psutil.AccessDenied, PermissionError):
             pass
 
+        self._resolve_hostnames(connections)
+        self._prune_name_cache()
         return connections
 
-    def _build_connection(self, conn, proc_names: dict, protocol: str) -> Optional[ConnectionInfo]:
+    def _get_process(self, pid: int, procs: dict) -> psutil.Process:
+        """Get the Process handle for a pid, creating it once per refresh."""
+        proc = procs.get(pid)
+        if proc is None:
+            proc = procs[pid] = psutil.Process(pid)
+        return proc
+
+    def _get_process_name(self, pid: int, procs: dict) -> str:
+        """Get a process name, only querying pids that actually own sockets."""
+        now = time.monotonic()
+        cached = self._name_cache.get(pid)
+        if cached and now < cached[1]:
+            return cached[0]
+
+        try:
+            name = self._get_process(pid, procs).name() or ""
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            name = ""
+        self._name_cache[pid] = (name, now + _NAME_TTL)
+        return name
+
+    def _prune_name_cache(self):
+        """Drop expired pid -> name entries."""
+        now = time.monotonic()
+        stale = [pid for pid, (_, expiry) in self._name_cache.items() if now >= expiry]
+        for pid in stale:
+            del self._name_cache[pid]
+
+    def _resolve_hostnames(self, connections: list[ConnectionInfo]):
+        """Fill in remote hostnames, resolving uncached IPs concurrently."""
+        hostnames: dict[str, str] = {}
+        misses = []
+        for ip in {c.remote_addr for c in connections}:
+            if not _wants_dns(ip):
+                continue
+            hostname = self._dns_cache.get(ip)
+            if hostname is None:
+                misses.append(ip)
+            else:
+                hostnames[ip] = hostname
+
+        if misses:
+            # getnameinfo blocks, so fan the uncached lookups out over the pool
+            resolved = dict(zip(misses, self._pool.map(self._lookup_hostname, misses)))
+            self._dns_cache.update(resolved)
+            hostnames.update(resolved)
+
+        for ci in connections:
+            ci.remote_hostname = hostnames.get(ci.remote_addr, "")
+
+    @staticmethod
+    def _lookup_hostname(ip: str) -> str:
+        """Uncached reverse DNS lookup."""
+        try:
+            hostname, _ = socket.getnameinfo((ip, 0), socket.NI_NAMEREQD)
+            return hostname
+        except (socket.gaierror, OSError):
+            return ""
+
+    def _build_connection(self, conn, procs: dict, protocol: str) -> Optional[ConnectionInfo]:
         """Build a ConnectionInfo from a psutil connection."""
         pid = conn.pid
-        name = proc_names.get(pid, "")
+        name = self._get_process_name(pid, procs)
 
         local_addr = conn.laddr.ip if conn.laddr else ""
         local_port = conn.laddr.port if conn.laddr else 0
@@ -117,61 +339,37 @@ class NetworkMonitor:
             state=state,
         )
 
-        # Reverse DNS
-        if remote_addr and remote_addr not in ("", "0.0.0.0", "::", "127.0.0.1", "::1"):
-            ci.remote_hostname = self._resolve_dns(remote_addr)
-
         # Suspicious connection detection
-        is_suspicious, reason = self._check_suspicious(ci)
+        is_suspicious, reason = self._check_suspicious(ci, procs)
         ci.is_suspicious = is_suspicious
         ci.suspicion_reason = reason
 
         return ci
 
-    def _resolve_dns(self, ip: str) -> str:
-        """Reverse DNS lookup with caching."""
-        with self._lock:
-            if ip in self._dns_cache:
-                return self._dns_cache[ip]
-
-        try:
-            hostname = socket.gethostbyaddr(ip)[0]
-        except (socket.herror, socket.gaierror, OSError):
-            hostname = ""
-
-        with self._lock:
-            self._dns_cache[ip] = hostname
-
-        return hostname
-
-    def _check_suspicious(self, conn: ConnectionInfo) -> tuple[bool, str]:
+    def _check_suspicious(self, conn: ConnectionInfo, procs: dict) -> tuple[bool, str]:
         """Check if a connection looks suspicious."""
         reasons = []
+        name_lower = conn.process_name.lower()
+        is_legit = name_lower in _LEGIT_NETWORK_PROCS
 
         # Check suspicious ports
-        if conn.remote_port in _SUSPICIOUS_PORTS:
-            name_lower = conn.process_name.lower()
-            if name_lower not in _LEGIT_NETWORK_PROCS:
-                reasons.append(f"Suspicious port {conn.remote_port}")
+        if conn.remote_port in _SUSPICIOUS_PORTS and not is_legit:
+            reasons.append(f"Suspicious port {conn.remote_port}")
 
         # Check if process is running from suspicious location
-        if conn.process_name:
+        # (known network apps are skipped to avoid the exe() query)
+        if name_lower and not is_legit:
             try:
-                proc = psutil.Process(conn.pid)
-                exe = proc.exe()
-                if exe:
-                    exe_lower = exe.lower()
-                    for spath in _SUSPICIOUS_PATHS:
-                        if spath in exe_lower:
-                            reasons.append(f"Process running from suspicious location")
-                            break
+                proc = self._get_process(conn.pid, procs)
+                exe = _get_exe(conn.pid, proc.create_time())
+                if exe and _SUSPICIOUS_PATH_RE.search(exe.lower()):
+                    reasons.append(f"Process running from suspicious location")
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
 
         # Non-browser process on IRC port
-        if conn.remote_port in (6667, 6697):
-            if conn.process_name.lower() not in ('hexchat.exe', 'mirc.exe', 'irssi.exe'):
-                reasons.append("IRC port (commonly used for C2 communication)")
+        if conn.remote_port in _IRC_PORTS and name_lower not in _IRC_CLIENTS:
+            reasons.append("IRC port (commonly used for C2 communication)")
 
         if reasons:
             return True, "; ".join(reasons)
@@ -10,38 +10,79 @@ import re
 from typing import Optional
 from functools import lru_cache
 
+try:
+    import orjson  # Optional: faster parse of the description database
+except ImportError:
+    orjson = None
+
 
 _DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "resources", "process_db.json")
 _process_db: dict = {}
+_db_loaded = False  # set after the first load attempt, even if the file was missing or bad
+
+# Process/service names repeat every refresh, so memoize their lowercase form
+_lower = lru_cache(maxsize=2048)(str.lower)
 
 
 def load_database():
     """Load the process description database from JSON."""
-    global _process_db
+    global _process_db, _db_loaded
     try:
-        with open(_DB_PATH, "r", encoding="utf-8") as f:
-            _process_db = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        _process_db = {}
+        with open(_DB_PATH, "rb") as f:
+            raw = f.read()
+        db = orjson.loads(raw) if orjson else json.loads(raw)
+        # Canonicalize keys once so lookups never need to re-lowercase them
+        db = {k.lower(): v for k, v in db.items()}
+        svchost = db.get("svchost.exe")
+        if svchost and "service_descriptions" in svchost:
+            svchost["service_descriptions"] = {
+                k.lower(): v for k, v in svchost["service_descriptions"].items()
+            }
+    except (OSError, ValueError):
+        db = {}
+    _db_loaded = True
+    if db != _process_db:
+        _process_db = db
+        _clear_resolver_caches()
+
+
+def _clear_resolver_caches():
+    """Drop memoized lookups that were derived from a previous database load."""
+    _resolve_description_cached.cache_clear()
+    resolve_kill_impact.cache_clear()
+    resolve_category.cache_clear()
+    _resolve_safety_cached.cache_clear()
 
 
 def get_process_info(name: str) -> Optional[dict]:
     """Get known info about a process by its executable name."""
-    if not _process_db:
+    return _lookup(_lower(name))
+
+
+def _lookup(name_lower: str) -> Optional[dict]:
+    """Database lookup for a name the caller has already lowercased."""
+    if not _db_loaded:
         load_database()
-    return _process_db.get(name.lower())
+    return _process_db.get(name_lower)
+
+
+def known_process_names() -> frozenset:
+    """All (lowercase) process names in the description database."""
+    if not _db_loaded:
+        load_database()
+    return frozenset(_process_db)
 
 
 def get_svchost_service_description(service_name: str) -> str:
     """Get a friendly description for a service hosted by svchost.exe."""
-    if not _process_db:
+    if not _db_loaded:
         load_database()
     svchost = _process_db.get("svchost.exe", {})
     descs = svchost.get("service_descriptions", {})
-    return descs.get(service_name.lower(), f"Windows Service: {service_name}")
+    return descs.get(_lower(service_name), f"Windows Service: {service_name}")
 
 
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=4096)
 def get_file_description(exe_path: str) -> Optional[str]:
     """Extract the FileDescription from an executable's version info."""
     if not exe_path or not os.path.isfile(exe_path):
@@ -63,7 +104,7 @@ def get_file_description(exe_path: str) -> Optional[str]:
     return None
 
 
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=4096)
 def get_file_company(exe_path: str) -> Optional[str]:
     """Extract the CompanyName from an executable's version info."""
     if not exe_path or not os.path.isfile(exe_path):
@@ -120,170 +161,235 @@ _PARENT_APP_NAMES = {
 }
 
 # Processes that are "helper" types — describe them by what they serve
-_HELPER_PROCESSES = {
+_HELPER_PROCESSES = frozenset({
     "conhost.exe", "crashpad_handler.exe", "msedgewebview2.exe",
     "runtimebroker.exe", "dllhost.exe", "backgroundtaskhost.exe",
     "werfault.exe", "werfaultsecure.exe",
+})
+
+
+# Command-line patterns used by _describe_from_cmdline
+_RE_WEBVIEW = re.compile(r'--webview-exe-name=(\S+)')
+_RE_JAR = re.compile(r'-jar\s+"?([^"\s]+)')
+_RE_JAVA_CLASS = re.compile(r'(?:^|\s)([a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)+)\s*$')
+_RE_PS_FILE = re.compile(r'-(?:file|f)\s+"?([^"\s]+)', re.IGNORECASE)
+_RE_SVC = re.compile(r'-s\s+(\S+)')
+_RE_DLL = re.compile(r'(\w+\.dll)', re.IGNORECASE)
+_RE_CHROM_TYPE = re.compile(r'--type=([\w-]+)')
+
+# Chromium --type= value -> role description
+_CHROMIUM_TYPES = {
+    "renderer": "Tab renderer (displays a web page)",
+    "gpu-process": "GPU process (hardware-accelerated graphics)",
+    "crashpad-handler": "Crash reporter (sends crash data if the browser crashes)",
+    "broker": "Security broker (manages permissions between processes)",
+}
+
+# Chromium utility sub-services, checked in order
+_CHROMIUM_UTILITY_TYPES = {
+    "network": "Network service (handles all web requests)",
+    "audio": "Audio service (plays sounds from web pages)",
+    "storage": "Storage service (manages cookies, cache, etc.)",
 }
 
 
 def _get_parent_app_name(parent_name: str) -> str:
     """Get a friendly name for a parent process."""
-    return _PARENT_APP_NAMES.get(parent_name.lower(), parent_name)
+    return _PARENT_APP_NAMES.get(_lower(parent_name), parent_name)
+
+
+def _process_type(cmd_lower: str) -> Optional[str]:
+    """Value of the Chromium/Electron --type= switch, or None."""
+    m = _RE_CHROM_TYPE.search(cmd_lower)
+    return m.group(1) if m else None
+
+
+def _describe_chromium(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """Chrome / Edge / Brave / Opera (Chromium-based browsers)."""
+    browser = _PARENT_APP_NAMES.get(name_lower, name_lower)
+    proc_type = _process_type(cmd_lower)
+    if proc_type is None:
+        return f"{browser} — Main browser process (manages all tabs and extensions)"
+    if proc_type == "utility":
+        for service, role in _CHROMIUM_UTILITY_TYPES.items():
+            if service in cmd_lower:
+                return f"{browser} — {role}"
+        return f"{browser} — Utility process (background helper)"
+    role = _CHROMIUM_TYPES.get(proc_type)
+    return f"{browser} — {role}" if role else None
+
+
+def _describe_vscode(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """VS Code (Electron)."""
+    proc_type = _process_type(cmd_lower)
+    if proc_type == "renderer":
+        return "VS Code — Editor window renderer"
+    elif proc_type == "gpu-process":
+        return "VS Code — GPU acceleration process"
+    elif proc_type == "utility":
+        return "VS Code — Utility helper process"
+    elif "extensionhost" in cmd_lower:
+        return "VS Code — Extension Host (runs all your extensions)"
+    elif proc_type is None:
+        return "VS Code — Main process"
+    return None
 
 
-def _describe_from_cmdline(proc_name: str, cmdline: str, exe_path: str) -> Optional[str]:
-    """Try to extract a meaningful description from the command line arguments."""
-    name_lower = proc_name.lower()
-    cmd_lower = cmdline.lower()
-
-    # --- Chrome / Edge / Brave (Chromium-based) ---
-    if name_lower in ("chrome.exe", "msedge.exe", "brave.exe", "opera.exe"):
-        browser = _PARENT_APP_NAMES.get(name_lower, proc_name)
-        if "--type=renderer" in cmd_lower:
-            return f"{browser} — Tab renderer (displays a web page)"
-        elif "--type=gpu-process" in cmd_lower:
-            return f"{browser} — GPU process (hardware-accelerated graphics)"
-        elif "--type=utility" in cmd_lower:
-            if "network" in cmd_lower:
-                return f"{browser} — Network service (handles all web requests)"
-            elif "audio" in cmd_lower:
-                return f"{browser} — Audio service (plays sounds from web pages)"
-            elif "storage" in cmd_lower:
-                return f"{browser} — Storage service (manages cookies, cache, etc.)"
-            return f"{browser} — Utility process (background helper)"
-        elif "--type=crashpad-handler" in cmd_lower:
-            return f"{browser} — Crash reporter (sends crash data if the browser crashes)"
-        elif "--type=broker" in cmd_lower:
-            return f"{browser} — Security broker (manages permissions between processes)"
-        elif "--type=" not in cmd_lower:
-            return f"{browser} — Main browser process (manages all tabs and extensions)"
-
-    # --- VS Code ---
-    if name_lower == "code.exe":
-        if "--type=renderer" in cmd_lower:
-            return "VS Code — Editor window renderer"
-        elif "--type=gpu-process" in cmd_lower:
-            return "VS Code — GPU acceleration process"
-        elif "--type=utility" in cmd_lower:
-            return "VS Code — Utility helper process"
-        elif "extensionhost" in cmd_lower.lower():
-            return "VS Code — Extension Host (runs all your extensions)"
-        elif "--type=" not in cmd_lower:
-            return "VS Code — Main process"
-
-    # --- msedgewebview2.exe ---
-    if name_lower == "msedgewebview2.exe":
-        if "--type=renderer" in cmd_lower:
-            return "Edge WebView2 — Rendering web content for an app"
-        elif "--type=gpu-process" in cmd_lower:
-            return "Edge WebView2 — GPU acceleration for embedded web content"
-        # Try to figure out which app is using it from the cmdline
-        webview_match = re.search(r'--webview-exe-name=(\S+)', cmdline)
-        if webview_match:
-            app_name = webview_match.group(1)
-            return f"Edge WebView2 — Embedded browser for {app_name}"
-
-    # --- Python scripts ---
-    if name_lower in ("python.exe", "pythonw.exe"):
-        # Look for the script name in the cmdline
-        parts = cmdline.split()
-        for part in parts[1:]:
-            p = part.strip('"').strip("'")
-            if p.endswith('.py') or p.endswith('.pyw'):
-                script = os.path.basename(p)
-                return f"Python — Running script: {script}"
-            if p == "-m":
-                # Next arg is the module
-                idx = parts.index(part)
-                if idx + 1 < len(parts):
-                    module = parts[idx + 1].strip('"')
-                    return f"Python — Running module: {module}"
-            if p == "-c":
-                return "Python — Running inline code"
-        return "Python — Interpreter running"
-
-    # --- Node.js ---
-    if name_lower == "node.exe":
-        parts = cmdline.split()
-        for part in parts[1:]:
-            p = part.strip('"').strip("'")
-            if p.endswith('.js') or p.endswith('.mjs') or p.endswith('.ts'):
-                script = os.path.basename(p)
-                return f"Node.js — Running: {script}"
-        if "npm" in cmd_lower:
-            return "Node.js — Running npm (package manager)"
-        if "npx" in cmd_lower:
-            return "Node.js — Running npx command"
-        return "Node.js — JavaScript runtime"
-
-    # --- Java ---
-    if name_lower in ("java.exe", "javaw.exe"):
-        if "minecraft" in cmd_lower:
-            return "Java — Running Minecraft"
-        if "eclipse" in cmd_lower:
-            return "Java — Running Eclipse IDE"
-        # Look for -jar or main class
-        jar_match = re.search(r'-jar\s+"?([^"\s]+)', cmdline)
-        if jar_match:
-            jar = os.path.basename(jar_match.group(1))
-            return f"Java — Running: {jar}"
-        class_match = re.search(r'(?:^|\s)([a-zA-Z_]\w*(?:\.[a-zA-Z_]\w*)+)\s*$', cmdline)
-        if class_match:
-            return f"Java — Running class: {class_match.group(1)}"
-
-    # --- cmd.exe ---
-    if name_lower == "cmd.exe":
-        if "/c " in cmd_lower:
-            cmd_part = cmdline.split("/c ", 1)[-1][:80]
-            return f"Command Prompt — Running: {cmd_part}"
-        if "/k " in cmd_lower:
-            cmd_part = cmdline.split("/k ", 1)[-1][:80]
-            return f"Command Prompt — Running: {cmd_part}"
-
-    # --- PowerShell ---
-    if name_lower in ("powershell.exe", "pwsh.exe"):
-        ps_name = "PowerShell" if name_lower == "powershell.exe" else "PowerShell 7"
-        if "-file " in cmd_lower or "-f " in cmd_lower:
-            file_match = re.search(r'-(?:file|f)\s+"?([^"\s]+)', cmdline, re.IGNORECASE)
-            if file_match:
-                script = os.path.basename(file_match.group(1))
-                return f"{ps_name} — Running script: {script}"
-        if "-command " in cmd_lower or "-c " in cmd_lower:
-            return f"{ps_name} — Running a command"
-        if "-encodedcommand" in cmd_lower:
-            return f"{ps_name} — Running an encoded command"
-
-    # --- svchost.exe (handled separately but add cmdline context) ---
-    if name_lower == "svchost.exe":
-        svc_match = re.search(r'-s\s+(\S+)', cmdline)
-        if svc_match:
-            svc_name = svc_match.group(1)
-            desc = get_svchost_service_description(svc_name)
-            return f"Service Host: {desc}"
-
-    # --- rundll32.exe ---
-    if name_lower == "rundll32.exe":
-        parts = cmdline.split(None, 1)
-        if len(parts) > 1:
-            dll_part = parts[1][:100]
-            # Try to extract meaningful DLL name
-            dll_match = re.search(r'(\w+\.dll)', dll_part, re.IGNORECASE)
-            if dll_match:
-                return f"Running DLL function: {dll_match.group(1)} — {dll_part[:60]}"
-
-    # --- msiexec.exe ---
-    if name_lower == "msiexec.exe":
-        if "/i " in cmd_lower:
-            return "Windows Installer — Installing software"
-        if "/x " in cmd_lower:
-            return "Windows Installer — Uninstalling software"
-        if "/p " in cmd_lower:
-            return "Windows Installer — Applying patch"
+def _describe_webview2(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """msedgewebview2.exe."""
+    proc_type = _process_type(cmd_lower)
+    if proc_type == "renderer":
+        return "Edge WebView2 — Rendering web content for an app"
+    elif proc_type == "gpu-process":
+        return "Edge WebView2 — GPU acceleration for embedded web content"
+    # Try to figure out which app is using it from the cmdline
+    webview_match = _RE_WEBVIEW.search(cmdline)
+    if webview_match:
+        app_name = webview_match.group(1)
+        return f"Edge WebView2 — Embedded browser for {app_name}"
+    return None
+
+
+def _describe_python(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> str:
+    """Python scripts."""
+    # Look for the script name in the cmdline
+    for idx, part in enumerate(argv[1:], start=1):
+        p = part.strip('"').strip("'")
+        if p.endswith('.py') or p.endswith('.pyw'):
+            script = os.path.basename(p)
+            return f"Python — Running script: {script}"
+        if p == "-m":
+            # Next arg is the module
+            if idx + 1 < len(argv):
+                module = argv[idx + 1].strip('"')
+                return f"Python — Running module: {module}"
+        if p == "-c":
+            return "Python — Running inline code"
+    return "Python — Interpreter running"
+
+
+def _describe_node(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> str:
+    """Node.js."""
+    for part in argv[1:]:
+        p = part.strip('"').strip("'")
+        if p.endswith('.js') or p.endswith('.mjs') or p.endswith('.ts'):
+            script = os.path.basename(p)
+            return f"Node.js — Running: {script}"
+    if "npm" in cmd_lower:
+        return "Node.js — Running npm (package manager)"
+    if "npx" in cmd_lower:
+        return "Node.js — Running npx command"
+    return "Node.js — JavaScript runtime"
+
+
+def _describe_java(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """Java."""
+    if "minecraft" in cmd_lower:
+        return "Java — Running Minecraft"
+    if "eclipse" in cmd_lower:
+        return "Java — Running Eclipse IDE"
+    # Look for -jar or main class
+    jar_match = _RE_JAR.search(cmdline)
+    if jar_match:
+        jar = os.path.basename(jar_match.group(1))
+        return f"Java — Running: {jar}"
+    class_match = _RE_JAVA_CLASS.search(cmdline)
+    if class_match:
+        return f"Java — Running class: {class_match.group(1)}"
+    return None
+
+
+def _describe_cmd(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """cmd.exe."""
+    if "/c " in cmd_lower:
+        cmd_part = cmdline.split("/c ", 1)[-1][:80]
+        return f"Command Prompt — Running: {cmd_part}"
+    if "/k " in cmd_lower:
+        cmd_part = cmdline.split("/k ", 1)[-1][:80]
+        return f"Command Prompt — Running: {cmd_part}"
+    return None
+
+
+def _describe_powershell(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """PowerShell / PowerShell 7."""
+    ps_name = "PowerShell" if name_lower == "powershell.exe" else "PowerShell 7"
+    if "-file " in cmd_lower or "-f " in cmd_lower:
+        file_match = _RE_PS_FILE.search(cmdline)
+        if file_match:
+            script = os.path.basename(file_match.group(1))
+            return f"{ps_name} — Running script: {script}"
+    if "-command " in cmd_lower or "-c " in cmd_lower:
+        return f"{ps_name} — Running a command"
+    if "-encodedcommand" in cmd_lower:
+        return f"{ps_name} — Running an encoded command"
+    return None
 
+
+def _describe_svchost(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """svchost.exe (handled separately but add cmdline context)."""
+    svc_match = _RE_SVC.search(cmdline)
+    if svc_match:
+        svc_name = svc_match.group(1)
+        desc = get_svchost_service_description(svc_name)
+        return f"Service Host: {desc}"
+    return None
+
+
+def _describe_rundll32(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """rundll32.exe."""
+    parts = cmdline.split(None, 1)
+    if len(parts) > 1:
+        dll_part = parts[1][:100]
+        # Try to extract meaningful DLL name
+        dll_match = _RE_DLL.search(dll_part)
+        if dll_match:
+            return f"Running DLL function: {dll_match.group(1)} — {dll_part[:60]}"
     return None
 
 
+def _describe_msiexec(name_lower: str, cmdline: str, cmd_lower: str, argv: list) -> Optional[str]:
+    """msiexec.exe."""
+    if "/i " in cmd_lower:
+        return "Windows Installer — Installing software"
+    if "/x " in cmd_lower:
+        return "Windows Installer — Uninstalling software"
+    if "/p " in cmd_lower:
+        return "Windows Installer — Applying patch"
+    return None
+
+
+# Process name -> command-line handler, so each process hits exactly one branch
+_CMDLINE_HANDLERS = {
+    "chrome.exe": _describe_chromium,
+    "msedge.exe": _describe_chromium,
+    "brave.exe": _describe_chromium,
+    "opera.exe": _describe_chromium,
+    "code.exe": _describe_vscode,
+    "msedgewebview2.exe": _describe_webview2,
+    "python.exe": _describe_python,
+    "pythonw.exe": _describe_python,
+    "node.exe": _describe_node,
+    "java.exe": _describe_java,
+    "javaw.exe": _describe_java,
+    "cmd.exe": _describe_cmd,
+    "powershell.exe": _describe_powershell,
+    "pwsh.exe": _describe_powershell,
+    "svchost.exe": _describe_svchost,
+    "rundll32.exe": _describe_rundll32,
+    "msiexec.exe": _describe_msiexec,
+}
+
+
+def _describe_from_cmdline(proc_name: str, cmdline: str, exe_path: str) -> Optional[str]:
+    """Try to extract a meaningful description from the command line arguments."""
+    name_lower = _lower(proc_name)
+    handler = _CMDLINE_HANDLERS.get(name_lower)
+    if handler is None:
+        return None
+    # Tokenize once; handlers test argv instead of rescanning the whole string
+    return handler(name_lower, cmdline, cmdline.lower(), cmdline.split())
+
+
 def resolve_description(proc_name: str, exe_path: Optional[str] = None,
                         services: Optional[list] = None,
                         cmdline: str = "",
@@ -293,11 +399,20 @@ def resolve_description(proc_name: str, exe_path: Optional[str] = None,
     Resolve a friendly description for a process.
     Priority: cmdline analysis > DB + context > svchost service > exe metadata > fallback.
     """
-    name_lower = proc_name.lower()
+    return _resolve_description_cached(
+        proc_name, exe_path or "", tuple(services or ()), cmdline, parent_name
+    )
+
+
+@lru_cache(maxsize=4096)
+def _resolve_description_cached(proc_name: str, exe_path: str, services: tuple,
+                                cmdline: str, parent_name: str) -> str:
+    """Memoized body of resolve_description — inputs rarely change for a live process."""
+    name_lower = _lower(proc_name)
 
     # 1. Try cmdline-based description (most specific)
     if cmdline:
-        cmdline_desc = _describe_from_cmdline(proc_name, cmdline, exe_path or "")
+        cmdline_desc = _describe_from_cmdline(proc_name, cmdline, exe_path)
         if cmdline_desc:
             return cmdline_desc
 
@@ -319,7 +434,7 @@ def resolve_description(proc_name: str, exe_path: Optional[str] = None,
             return desc
 
     # 3. DB lookup
-    info = get_process_info(name_lower)
+    info = _lookup(name_lower)
     if info:
         base_desc = info.get("description", proc_name)
 
@@ -337,7 +452,7 @@ def resolve_description(proc_name: str, exe_path: Optional[str] = None,
         file_desc = get_file_description(exe_path)
         if file_desc:
             # Add parent context if available
-            if parent_name and parent_name.lower() not in ("explorer.exe", "services.exe",
+            if parent_name and _lower(parent_name) not in ("explorer.exe", "services.exe",
                                                             "svchost.exe", "wininit.exe"):
                 parent_app = _get_parent_app_name(parent_name)
                 return f"{file_desc} (launched by {parent_app})"
@@ -351,17 +466,19 @@ def resolve_description(proc_name: str, exe_path: Optional[str] = None,
     return proc_name
 
 
+@lru_cache(maxsize=4096)
 def resolve_kill_impact(proc_name: str) -> str:
     """Resolve the kill impact description for a process."""
-    info = get_process_info(proc_name.lower())
+    info = _lookup(_lower(proc_name))
     if info:
         return info.get("kill_impact", "")
     return ""
 
 
+@lru_cache(maxsize=4096)
 def resolve_category(proc_name: str) -> str:
     """Resolve the category for a process."""
-    info = get_process_info(proc_name.lower())
+    info = _lookup(_lower(proc_name))
     if info:
         return info.get("category", "unknown")
     return "unknown"
@@ -369,19 +486,23 @@ def resolve_category(proc_name: str) -> str:
 
 def resolve_safety(proc_name: str) -> dict:
     """Resolve safety information for terminating a process."""
-    info = get_process_info(proc_name.lower())
-    if info:
-        return {
-            "safe_to_kill": info.get("safe_to_kill", True),
-            "warning": info.get("kill_warning", ""),
-            "category": info.get("category", "unknown"),
-        }
+    safe_to_kill, warning, category = _resolve_safety_cached(_lower(proc_name))
     return {
-        "safe_to_kill": True,
-        "warning": "",
-        "category": "unknown",
+        "safe_to_kill": safe_to_kill,
+        "warning": warning,
+        "category": category,
     }
 
 
-# Pre-load on import
-load_database()
+@lru_cache(maxsize=4096)
+def _resolve_safety_cached(name_lower: str) -> tuple[bool, str, str]:
+    """Memoized (safe_to_kill, warning, category) for resolve_safety."""
+    info = _lookup(name_lower)
+    if info:
+        return (
+            info.get("safe_to_kill", True),
+            info.get("kill_warning", ""),
+            info.get("category", "unknown"),
+        )
+    return True, "", "unknown"
+
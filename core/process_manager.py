@@ -2,9 +2,11 @@
 Core process manager — collects detailed process information using psutil, WMI, and Win32 API.
 """
 
+import heapq
 import os
 import time
 import threading
+from array import array
 from typing import Optional
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -18,7 +20,17 @@ from core.process_descriptions import (
 from core.safety_tiers import classify_process, SafetyInfo, SafetyTier
 
 
-@dataclass
+# get_top_processes falls back to its own light sweep when the process snapshot is older than this (seconds)
+_TOP_PROCESSES_MAX_AGE = 0.5
+
+# How often check_respawn polls for new processes (seconds)
+_RESPAWN_POLL_INTERVAL = 0.5
+
+# How often get_current re-reads CPU frequency and disk usage (seconds)
+_SLOW_METRICS_INTERVAL = 1.0
+
+
+@dataclass(slots=True)
 class ProcessInfo:
     pid: int = 0
     name: str = ""
@@ -45,11 +57,20 @@ class ProcessInfo:
     username: str = ""
     start_time: Optional[datetime] = None
     exe_path: str = ""
-    cmdline: str = ""
-    services: list = field(default_factory=list)
+    cmdline_parts: Optional[list] = None  # argv as returned by psutil
+    services: tuple = ()
     kill_impact: str = ""
+    search_text: str = ""  # lowercase "pid name description company exe" for the UI filter
     is_elevated: bool = False
     is_suspended: bool = False
+    _cmdline: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def cmdline(self) -> str:
+        """Full command line, joined on first access."""
+        if self._cmdline is None:
+            self._cmdline = " ".join(self.cmdline_parts) if self.cmdline_parts else ""
+        return self._cmdline
 
 
 class ProcessManager:
@@ -58,9 +79,18 @@ class ProcessManager:
     def __init__(self):
         self._processes: dict[int, ProcessInfo] = {}
         self._prev_io: dict[int, tuple] = {}  # pid -> (read_bytes, write_bytes, timestamp)
+        self._prev_cpu: dict[int, tuple] = {}  # pid -> (user + system seconds, timestamp)
         self._prev_net: dict[int, tuple] = {}  # pid -> (sent, recv, timestamp)
         self._lock = threading.Lock()
-        self._svchost_services: dict[int, list] = {}
+        self._collect_lock = threading.Lock()  # one sweep at a time (shared delta state)
+        self.last_collected = 0.0  # time.monotonic() of the last published snapshot
+        self._svchost_services: dict[int, tuple] = {}
+        # (pid, create_time) -> (category, kill_impact, company, safety_info); survives PID reuse
+        self._meta_cache: dict[tuple[int, float], tuple] = {}
+        # (pid, create_time, services, parent_name) -> description; (pid, create_time) survives PID reuse
+        self._desc_cache: dict[tuple, str] = {}
+        # (pid, name, description, company, exe_path) -> search_text
+        self._search_cache: dict[tuple, str] = {}
         self._gpu_available = False
         self._init_gpu()
 
@@ -73,8 +103,14 @@ class ProcessManager:
         except Exception:
             self._gpu_available = False
 
-    def _get_svchost_services(self) -> dict[int, list]:
-        """Map svchost PIDs to their hosted service names using WMI."""
+    def _get_svchost_services(self) -> dict[int, tuple]:
+        """Map svchost PIDs to their hosted service names."""
+        try:
+            return self._get_svchost_services_fast()
+        except Exception:
+            pass
+
+        # Fallback: WMI (one COM round-trip per service)
         result = {}
         try:
             import wmi
@@ -87,7 +123,26 @@ class ProcessManager:
                     result[pid].append(service.Name)
         except Exception:
             pass
-        return result
+        return {pid: tuple(names) for pid, names in result.items()}
+
+    @staticmethod
+    def _get_svchost_services_fast() -> dict[int, tuple]:
+        """Map PIDs to service names with a single EnumServicesStatusEx call."""
+        import win32service
+        scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_ENUMERATE_SERVICE)
+        try:
+            services = win32service.EnumServicesStatusEx(
+                scm, win32service.SERVICE_WIN32, win32service.SERVICE_ACTIVE
+            )
+        finally:
+            win32service.CloseServiceHandle(scm)
+
+        result = {}
+        for service in services:
+            pid = service["ProcessId"]
+            if pid > 0:
+                result.setdefault(pid, []).append(service["ServiceName"])
+        return {pid: tuple(names) for pid, names in result.items()}
 
     def refresh_services_map(self):
         """Refresh the svchost-to-services mapping (call periodically, not every refresh)."""
@@ -95,14 +150,24 @@ class ProcessManager:
 
     def collect_processes(self) -> dict[int, ProcessInfo]:
         """Collect information about all running processes."""
+        with self._collect_lock:
+            return self._collect_processes()
+
+    def _collect_processes(self) -> dict[int, ProcessInfo]:
+        """Body of collect_processes; caller holds _collect_lock."""
         now = time.time()
         new_processes = {}
 
-        for proc in psutil.process_iter([
-            'pid', 'name', 'cpu_percent', 'memory_info', 'memory_percent',
+        # process_iter(attrs) reads each process under oneshot(); materialize the
+        # sweep first so parent names come from it instead of a Process(ppid) each
+        procs = list(psutil.process_iter([
+            'pid', 'name', 'cpu_times', 'memory_info', 'memory_percent',
             'io_counters', 'num_threads', 'num_handles', 'status',
             'username', 'create_time', 'exe', 'cmdline', 'ppid'
-        ]):
+        ]))
+        name_by_pid = {p.info['pid']: p.info['name'] for p in procs}
+
+        for proc in procs:
             try:
                 pinfo = proc.info
                 pid = pinfo['pid']
@@ -111,96 +176,118 @@ class ProcessManager:
                     continue  # Skip processes with no name
                 exe_path = pinfo.get('exe') or ""
 
-                # Build ProcessInfo
-                pi = ProcessInfo()
-                pi.pid = pid
-                pi.name = name
-                pi.exe_path = exe_path
+                # CPU % from cpu_times deltas (same figure as psutil's cpu_percent,
+                # without its per-process timer and cpu_count calls)
+                cpu_percent = 0.0
+                cpu_times = pinfo.get('cpu_times')
+                if cpu_times:
+                    cpu_total = cpu_times.user + cpu_times.system
+                    prev = self._prev_cpu.get(pid)
+                    if prev:
+                        dt = now - prev[1]
+                        if dt > 0:
+                            cpu_percent = round(max(0.0, (cpu_total - prev[0]) / dt * 100), 1)
+                    self._prev_cpu[pid] = (cpu_total, now)
 
-                # CPU & Memory
-                pi.cpu_percent = pinfo.get('cpu_percent') or 0.0
+                # Memory
                 mem_info = pinfo.get('memory_info')
-                if mem_info:
-                    pi.memory_mb = mem_info.rss / (1024 * 1024)
-                pi.memory_percent = pinfo.get('memory_percent') or 0.0
+                memory_mb = mem_info.rss / (1024 * 1024) if mem_info else 0.0
 
                 # Disk I/O with rate calculation
+                disk_read_bytes = disk_write_bytes = 0
+                disk_read_speed = disk_write_speed = 0.0
                 io = pinfo.get('io_counters')
                 if io:
-                    pi.disk_read_bytes = io.read_bytes
-                    pi.disk_write_bytes = io.write_bytes
+                    disk_read_bytes = io.read_bytes
+                    disk_write_bytes = io.write_bytes
                     prev = self._prev_io.get(pid)
                     if prev:
                         dt = now - prev[2]
                         if dt > 0:
-                            pi.disk_read_speed = max(0, (io.read_bytes - prev[0]) / dt)
-                            pi.disk_write_speed = max(0, (io.write_bytes - prev[1]) / dt)
+                            disk_read_speed = max(0, (io.read_bytes - prev[0]) / dt)
+                            disk_write_speed = max(0, (io.write_bytes - prev[1]) / dt)
                     self._prev_io[pid] = (io.read_bytes, io.write_bytes, now)
 
-                # Thread/handle counts
-                pi.threads = pinfo.get('num_threads') or 0
-                pi.handles = pinfo.get('num_handles') or 0
-
-                # Status
-                pi.status = pinfo.get('status') or ""
-                pi.is_suspended = pi.status == psutil.STATUS_STOPPED
-
-                # Username
-                pi.username = pinfo.get('username') or ""
+                status = pinfo.get('status') or ""
+                username = pinfo.get('username') or ""
 
                 # Start time
+                start_time = None
                 create_time = pinfo.get('create_time')
                 if create_time:
                     try:
-                        pi.start_time = datetime.fromtimestamp(create_time)
+                        start_time = datetime.fromtimestamp(create_time)
                     except (OSError, ValueError):
                         pass
 
-                # Command line
+                # Command line (joined only when a description has to be resolved)
                 cmdline = pinfo.get('cmdline')
-                if cmdline:
-                    pi.cmdline = " ".join(cmdline)
 
                 # Services (for svchost)
-                if name.lower() == "svchost.exe" and pid in self._svchost_services:
-                    pi.services = self._svchost_services[pid]
+                services = ()
+                if name.lower() == "svchost.exe":
+                    services = self._svchost_services.get(pid, ())
 
                 # Get parent process name for context
-                parent_name = ""
                 ppid = pinfo.get('ppid')
+                parent_name = ""
                 if ppid and ppid > 0:
-                    try:
-                        parent = psutil.Process(ppid)
-                        parent_name = parent.name() or ""
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
+                    parent_name = name_by_pid.get(ppid) or ""
 
                 # Resolve description, category, safety, kill impact
-                pi.description = resolve_description(
-                    name, exe_path, pi.services,
-                    cmdline=pi.cmdline,
-                    parent_name=parent_name,
-                    parent_pid=ppid or 0,
+                desc_key = (pid, create_time, services, parent_name)
+                description = self._desc_cache.get(desc_key) if create_time else None
+                if description is None:
+                    description = resolve_description(
+                        name, exe_path, services,
+                        cmdline=" ".join(cmdline) if cmdline else "",
+                        parent_name=parent_name,
+                        parent_pid=ppid or 0,
+                    )
+                    if create_time:
+                        self._desc_cache[desc_key] = description
+                meta = self._meta_cache.get((pid, create_time)) if create_time else None
+                if meta is None:
+                    meta = self._resolve_metadata(pid, name, exe_path, username)
+                    if create_time:
+                        self._meta_cache[(pid, create_time)] = meta
+                category, kill_impact, company, safety_info = meta
+
+                # Filter text only changes with the fields it is built from
+                search_key = (pid, name, description, company, exe_path)
+                search_text = self._search_cache.get(search_key)
+                if search_text is None:
+                    search_text = f"{pid} {name} {description} {company} {exe_path}".lower()
+                    self._search_cache[search_key] = search_text
+
+                # Build ProcessInfo in one constructor call
+                pi = ProcessInfo(
+                    pid=pid,
+                    name=name,
+                    description=description,
+                    company=company,
+                    category=category,
+                    safety=safety_info.tier,
+                    safety_info=safety_info,
+                    cpu_percent=cpu_percent,
+                    memory_mb=memory_mb,
+                    memory_percent=pinfo.get('memory_percent') or 0.0,
+                    disk_read_bytes=disk_read_bytes,
+                    disk_write_bytes=disk_write_bytes,
+                    disk_read_speed=disk_read_speed,
+                    disk_write_speed=disk_write_speed,
+                    threads=pinfo.get('num_threads') or 0,
+                    handles=pinfo.get('num_handles') or 0,
+                    status=status,
+                    username=username,
+                    start_time=start_time,
+                    exe_path=exe_path,
+                    cmdline_parts=cmdline,
+                    services=services,
+                    kill_impact=kill_impact,
+                    search_text=search_text,
+                    is_suspended=status == psutil.STATUS_STOPPED,
                 )
-                pi.category = resolve_category(name)
-                pi.kill_impact = resolve_kill_impact(name)
-                pi.safety_info = classify_process(name, pid)
-                pi.safety = pi.safety_info.tier
-
-                # Company from exe metadata
-                if exe_path:
-                    company = get_file_company(exe_path)
-                    if company:
-                        pi.company = company
-
-                # If category is unknown but we have a company, try to classify
-                if pi.category == "unknown":
-                    if pi.username and ("SYSTEM" in pi.username.upper() or
-                                        "LOCAL SERVICE" in pi.username.upper() or
-                                        "NETWORK SERVICE" in pi.username.upper()):
-                        pi.category = "windows_service"
-                    else:
-                        pi.category = "user_app"
 
                 new_processes[pid] = pi
 
@@ -212,16 +299,46 @@ class ProcessManager:
         stale = set(self._prev_io.keys()) - active_pids
         for pid in stale:
             del self._prev_io[pid]
-
+        for pid in set(self._prev_cpu.keys()) - active_pids:
+            del self._prev_cpu[pid]
+        for key in [k for k in self._meta_cache if k[0] not in active_pids]:
+            del self._meta_cache[key]
+        for key in [k for k in self._desc_cache if k[0] not in active_pids]:
+            del self._desc_cache[key]
+        for key in [k for k in self._search_cache if k[0] not in active_pids]:
+            del self._search_cache[key]
+
+        # Publish the finished snapshot; readers never see a half-built dict
         with self._lock:
             self._processes = new_processes
+            self.last_collected = time.monotonic()
 
         return new_processes
 
+    @staticmethod
+    def _resolve_metadata(pid: int, name: str, exe_path: str, username: str) -> tuple:
+        """Category, kill impact, company and safety — stable for a process's lifetime."""
+        category = resolve_category(name)
+        kill_impact = resolve_kill_impact(name)
+        safety_info = classify_process(name, pid)
+
+        # Company from exe metadata
+        company = (get_file_company(exe_path) or "") if exe_path else ""
+
+        # If category is unknown but we have a company, try to classify
+        if category == "unknown":
+            if username and ("SYSTEM" in username.upper() or
+                             "LOCAL SERVICE" in username.upper() or
+                             "NETWORK SERVICE" in username.upper()):
+                category = "windows_service"
+            else:
+                category = "user_app"
+
+        return category, kill_impact, company, safety_info
+
     def get_processes(self) -> dict[int, ProcessInfo]:
-        """Get the last collected process data."""
-        with self._lock:
-            return dict(self._processes)
+        """Get the last collected process data (a snapshot; never mutated after publish)."""
+        return self._processes
 
     def kill_process(self, pid: int, force: bool = False) -> tuple[bool, str]:
         """Kill a process. Returns (success, message)."""
@@ -310,39 +427,127 @@ class ProcessManager:
 
     def get_process_by_pid(self, pid: int) -> Optional[ProcessInfo]:
         """Get a specific process info."""
-        with self._lock:
-            return self._processes.get(pid)
+        return self._processes.get(pid)
 
     def check_respawn(self, name: str, original_pid: int, delay: float = 3.0) -> Optional[int]:
         """Check if a process respawns after being killed. Returns new PID if found."""
-        time.sleep(delay)
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                if (proc.info['name'] and
-                    proc.info['name'].lower() == name.lower() and
-                    proc.info['pid'] != original_pid):
-                    return proc.info['pid']
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return None
+        # Only PIDs that appeared since the last snapshot can be a respawn,
+        # so names are looked up for new PIDs only
+        known = set(self._processes) or set(psutil.pids())
+        known.add(original_pid)
+        name_lower = name.lower()
+
+        deadline = time.monotonic() + delay
+        while True:
+            time.sleep(min(_RESPAWN_POLL_INTERVAL, max(0.0, deadline - time.monotonic())))
+            for pid in psutil.pids():
+                if pid in known:
+                    continue
+                known.add(pid)
+                try:
+                    if psutil.Process(pid).name().lower() == name_lower:
+                        return pid
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            if time.monotonic() >= deadline:
+                return None
+
+
+class _History:
+    """
+    Fixed-capacity ring buffer of (timestamp, value) samples.
+    Timestamps are stored as float64 and values as float32 in flat typed arrays.
+    width > 1 stores a tuple of that many values per sample.
+    """
+
+    def __init__(self, capacity: int, width: int = 1):
+        self._capacity = capacity
+        self._width = width
+        self._times = array('d', bytes(8 * capacity))
+        self._values = array('f', bytes(4 * capacity * width))
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("history index out of range")
+        slot = (self._start + index) % self._capacity
+        if self._width == 1:
+            return self._times[slot], self._values[slot]
+        base = slot * self._width
+        return self._times[slot], tuple(self._values[base:base + self._width])
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self[i]
+
+    def append(self, sample: tuple):
+        """Add a (timestamp, value) sample, overwriting the oldest when full."""
+        t, value = sample
+        slot = (self._start + self._len) % self._capacity
+        if self._len == self._capacity:
+            self._start = (self._start + 1) % self._capacity
+        else:
+            self._len += 1
+        self._times[slot] = t
+        if self._width == 1:
+            self._values[slot] = value
+        else:
+            base = slot * self._width
+            self._values[base:base + self._width] = array('f', value)
+
+    def popleft(self):
+        """Drop the oldest sample."""
+        if not self._len:
+            raise IndexError("pop from an empty history")
+        self._start = (self._start + 1) % self._capacity
+        self._len -= 1
 
 
 class PerformanceCollector:
     """Collects system-wide performance metrics."""
 
-    def __init__(self, history_minutes: int = 60):
+    def __init__(self, process_manager: ProcessManager, history_minutes: int = 60):
+        self.process_manager = process_manager
         self.history_minutes = history_minutes
         self.max_points = history_minutes * 30  # At 2s interval
-        self.cpu_history: list[tuple[float, float]] = []  # (timestamp, percent)
-        self.memory_history: list[tuple[float, float]] = []
-        self.disk_history: list[tuple[float, tuple]] = []  # (timestamp, (read_speed, write_speed))
-        self.net_history: list[tuple[float, tuple]] = []
-        self.gpu_history: list[tuple[float, float]] = []
+        self.cpu_history = _History(self.max_points)  # (timestamp, percent)
+        self.memory_history = _History(self.max_points)
+        self.disk_history = _History(self.max_points, width=2)  # (timestamp, (read_speed, write_speed))
+        self.net_history = _History(self.max_points, width=2)
+        self.gpu_history = _History(self.max_points)
         self._prev_disk = None
         self._prev_net = None
         self._prev_time = None
         self._lock = threading.Lock()
 
+        # Constant for the lifetime of the process
+        self._cpu_count = psutil.cpu_count()
+        self._cpu_count_phys = psutil.cpu_count(logical=False)
+
+        # Slow-changing metrics, re-read at most every _SLOW_METRICS_INTERVAL
+        self._cpu_freq = None
+        self._disk_usage = None
+        self._slow_metrics_at = 0.0
+
+        # Light pid/name/cpu/memory sweep for get_top_processes while the full snapshot is stale
+        self._top_prev_cpu: dict[int, tuple] = {}  # pid -> (user + system seconds, timestamp)
+        self._top_snapshot: list[ProcessInfo] = []
+        self._top_collected = 0.0
+
+        # Latest scalar readings, updated by collect() for per-tick consumers
+        self.cpu_percent = 0.0
+        self.memory_percent = 0.0
+        self.disk_percent = 0.0
+
+        # Prime psutil's system CPU counter so the first collect() has a baseline
+        psutil.cpu_percent(interval=None)
+
     def collect(self):
         """Collect a single snapshot of system-wide performance."""
         now = time.time()
@@ -377,33 +582,51 @@ class PerformanceCollector:
         self._prev_net = net
         self._prev_time = now
 
+        self._refresh_slow_metrics()
+        self.cpu_percent = cpu
+        self.memory_percent = mem.percent
+        self.disk_percent = self._disk_usage.percent
+
         with self._lock:
             self.cpu_history.append((now, cpu))
             self.memory_history.append((now, mem.percent))
             self.disk_history.append((now, (disk_read_speed, disk_write_speed)))
             self.net_history.append((now, (net_sent_speed, net_recv_speed)))
 
-            # Trim history
+            # Trim history (capacity bounds the count; this drops samples older than the window)
             cutoff = now - (self.history_minutes * 60)
-            self.cpu_history = [(t, v) for t, v in self.cpu_history if t > cutoff]
-            self.memory_history = [(t, v) for t, v in self.memory_history if t > cutoff]
-            self.disk_history = [(t, v) for t, v in self.disk_history if t > cutoff]
-            self.net_history = [(t, v) for t, v in self.net_history if t > cutoff]
+            for history in (self.cpu_history, self.memory_history,
+                            self.disk_history, self.net_history):
+                while history and history[0][0] <= cutoff:
+                    history.popleft()
+
+    def _refresh_slow_metrics(self):
+        """Re-read CPU frequency and disk usage once _SLOW_METRICS_INTERVAL has passed."""
+        now = time.monotonic()
+        if self._disk_usage is None or now - self._slow_metrics_at >= _SLOW_METRICS_INTERVAL:
+            self._cpu_freq = psutil.cpu_freq()
+            self._disk_usage = psutil.disk_usage('/')
+            self._slow_metrics_at = now
 
     def get_current(self) -> dict:
         """Get current system metrics."""
-        cpu = psutil.cpu_percent(interval=0)
-        cpu_freq = psutil.cpu_freq()
-        cpu_count = psutil.cpu_count()
-        cpu_count_phys = psutil.cpu_count(logical=False)
+        # Reuse the last collected sample; a second cpu_percent() call right
+        # after collect() would measure a near-zero interval
+        if self.cpu_history:
+            cpu = self.cpu_history[-1][1]
+        else:
+            cpu = psutil.cpu_percent(interval=None)
+
+        self._refresh_slow_metrics()
+        cpu_freq = self._cpu_freq
         mem = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        disk = self._disk_usage
 
         return {
             "cpu_percent": cpu,
             "cpu_freq_mhz": cpu_freq.current if cpu_freq else 0,
-            "cpu_count": cpu_count,
-            "cpu_count_physical": cpu_count_phys,
+            "cpu_count": self._cpu_count,
+            "cpu_count_physical": self._cpu_count_phys,
             "memory_total_gb": mem.total / (1024 ** 3),
             "memory_used_gb": mem.used / (1024 ** 3),
             "memory_percent": mem.percent,
@@ -412,23 +635,57 @@ class PerformanceCollector:
             "disk_percent": disk.percent,
         }
 
-    def get_top_processes(self, metric: str = "cpu", n: int = 5) -> list:
-        """Get top N processes by a given metric."""
-        procs = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-            try:
-                info = proc.info
-                if info['name']:
-                    procs.append(info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+    def get_top_processes(self, metric: str = "cpu", n: int = 5) -> list[ProcessInfo]:
+        """Get top N processes by a given metric, from the process manager's snapshot."""
+        pm = self.process_manager
+        now = time.monotonic()
+        if now - pm.last_collected <= _TOP_PROCESSES_MAX_AGE:
+            processes = pm.get_processes().values()
+        else:
+            # Full snapshot is stale (Processes tab not refreshing): sweep only what ranking needs
+            if now - self._top_collected > _TOP_PROCESSES_MAX_AGE:
+                self._top_snapshot = self._collect_top_candidates()
+                self._top_collected = now
+            processes = self._top_snapshot
 
         if metric == "cpu":
-            procs.sort(key=lambda p: p.get('cpu_percent') or 0, reverse=True)
+            return heapq.nlargest(n, processes, key=lambda p: p.cpu_percent)
         elif metric == "memory":
-            procs.sort(
-                key=lambda p: p.get('memory_info').rss if p.get('memory_info') else 0,
-                reverse=True,
-            )
+            return heapq.nlargest(n, processes, key=lambda p: p.memory_mb)
+        return list(processes)[:n]
+
+    def _collect_top_candidates(self) -> list[ProcessInfo]:
+        """Pid, name, CPU % and memory for every process, without the full collector's work."""
+        now = time.time()
+        prev_cpu = self._top_prev_cpu
+        seen = {}
+        result = []
+        for proc in psutil.process_iter(['pid', 'name', 'cpu_times', 'memory_info']):
+            try:
+                pinfo = proc.info
+                pid = pinfo['pid']
+                name = pinfo['name'] or ""
+                if not name:
+                    continue
 
-        return procs[:n]
+                cpu_percent = 0.0
+                cpu_times = pinfo.get('cpu_times')
+                if cpu_times:
+                    cpu_total = cpu_times.user + cpu_times.system
+                    prev = prev_cpu.get(pid)
+                    if prev:
+                        dt = now - prev[1]
+                        if dt > 0:
+                            cpu_percent = round(max(0.0, (cpu_total - prev[0]) / dt * 100), 1)
+                    seen[pid] = (cpu_total, now)
+
+                mem_info = pinfo.get('memory_info')
+                memory_mb = mem_info.rss / (1024 * 1024) if mem_info else 0.0
+                result.append(ProcessInfo(
+                    pid=pid, name=name, cpu_percent=cpu_percent, memory_mb=memory_mb
+                ))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        # Only live pids carry over, so exited processes do not accumulate
+        self._top_prev_cpu = seen
+        return result
@@ -6,8 +6,8 @@ Safety tier system for process termination.
 """
 
 from enum import Enum
-from typing import NamedTuple
-from core.process_descriptions import get_process_info
+from typing import NamedTuple, Optional
+from core.process_descriptions import get_process_info, known_process_names
 
 
 class SafetyTier(Enum):
@@ -33,124 +33,118 @@ _CATEGORY_TIERS = {
     "unknown": SafetyTier.GREEN,
 }
 
+# Shared results for the common cases — returned by reference, never rebuilt
+_SAFE_DEFAULT = SafetyInfo(SafetyTier.GREEN, "Safe", "", True)
+_SYSTEM_PID_INFO = SafetyInfo(
+    SafetyTier.RED, "System Critical", "Core operating system process. Cannot be terminated.", False
+)
+_CRITICAL_DEFAULT = SafetyInfo(
+    SafetyTier.RED, "System Critical", "System critical process. Terminating may crash Windows.", False
+)
+_CAUTION_DEFAULT = SafetyInfo(
+    SafetyTier.YELLOW, "Caution", "This service may affect system functionality.", True
+)
+_DB_CRITICAL_DEFAULT = SafetyInfo(SafetyTier.RED, "System Critical", "System critical process.", False)
+_DB_CAUTION_DEFAULT = SafetyInfo(
+    SafetyTier.YELLOW, "Caution", "This process provides important functionality.", True
+)
+_SERVICE_DEFAULT = SafetyInfo(
+    SafetyTier.YELLOW, "Caution", "Windows service — may affect functionality.", True
+)
+
 # Processes that are ALWAYS red-tier regardless of DB
-_ALWAYS_CRITICAL = {
+_ALWAYS_CRITICAL = frozenset({
     "system", "smss.exe", "csrss.exe", "wininit.exe", "winlogon.exe",
     "services.exe", "lsass.exe", "lsaiso.exe", "dwm.exe", "ntoskrnl.exe",
     "registry.exe", "memory_compression", "trustedinstaller.exe",
     "fontdrvhost.exe",
-}
+})
 
 # Yellow overrides — services that aren't critical but need caution
-_CAUTION_OVERRIDES = {
+_CAUTION_OVERRIDES = frozenset({
     "explorer.exe", "spoolsv.exe", "searchindexer.exe", "audiodg.exe",
     "msmpeng.exe", "securityhealthservice.exe", "wlanext.exe",
     "nissrv.exe", "wudfhost.exe",
-}
+})
 
 
 def classify_process(proc_name: str, pid: int = 0) -> SafetyInfo:
     """Classify a process into a safety tier for termination."""
-    name_lower = proc_name.lower()
-
     # PID 0 (System Idle) and PID 4 (System) are always critical
     if pid in (0, 4):
-        return SafetyInfo(
-            tier=SafetyTier.RED,
-            label="System Critical",
-            warning="Core operating system process. Cannot be terminated.",
-            can_kill=False,
-        )
+        return _SYSTEM_PID_INFO
+
+    return _safety_table().get(proc_name.lower(), _SAFE_DEFAULT)
+
+
+# name -> SafetyInfo for every known process; built on first use (needs the DB)
+_name_safety: Optional[dict[str, SafetyInfo]] = None
+
+
+def _safety_table() -> dict[str, SafetyInfo]:
+    """Precomputed classification of every name in the override lists and the DB."""
+    global _name_safety
+    if _name_safety is None:
+        names = _ALWAYS_CRITICAL | _CAUTION_OVERRIDES | known_process_names()
+        _name_safety = {name: _classify_name(name) for name in names}
+    return _name_safety
+
+
+def _with_warning(default: SafetyInfo, warning: str) -> SafetyInfo:
+    """The shared default, or a copy carrying the DB's bespoke warning."""
+    if not warning or warning == default.warning:
+        return default
+    return default._replace(warning=warning)
+
+
+def _classify_name(name_lower: str) -> SafetyInfo:
+    """Name-based part of classify_process."""
+    info = get_process_info(name_lower)
+    warning = info.get("kill_warning", "") if info else ""
 
     # Check hardcoded critical list
     if name_lower in _ALWAYS_CRITICAL:
-        info = get_process_info(name_lower)
-        warning = ""
-        if info:
-            warning = info.get("kill_warning", "System critical process. Terminating may crash Windows.")
-        else:
-            warning = "System critical process. Terminating may crash Windows."
-        return SafetyInfo(
-            tier=SafetyTier.RED,
-            label="System Critical",
-            warning=warning,
-            can_kill=False,
-        )
+        return _with_warning(_CRITICAL_DEFAULT, warning)
 
     # Check caution overrides
     if name_lower in _CAUTION_OVERRIDES:
-        info = get_process_info(name_lower)
-        warning = ""
-        if info:
-            warning = info.get("kill_warning", "This service may affect system functionality.")
-        else:
-            warning = "This service may affect system functionality."
-        return SafetyInfo(
-            tier=SafetyTier.YELLOW,
-            label="Caution",
-            warning=warning,
-            can_kill=True,
-        )
+        return _with_warning(_CAUTION_DEFAULT, warning)
 
     # Check database
-    info = get_process_info(name_lower)
     if info:
         category = info.get("category", "unknown")
         safe = info.get("safe_to_kill", True)
-        warning = info.get("kill_warning", "")
 
         if not safe and category == "system_critical":
-            return SafetyInfo(
-                tier=SafetyTier.RED,
-                label="System Critical",
-                warning=warning or "System critical process.",
-                can_kill=False,
-            )
+            return _with_warning(_DB_CRITICAL_DEFAULT, warning)
         elif not safe:
-            return SafetyInfo(
-                tier=SafetyTier.YELLOW,
-                label="Caution",
-                warning=warning or "This process provides important functionality.",
-                can_kill=True,
-            )
-        else:
-            tier = _CATEGORY_TIERS.get(category, SafetyTier.GREEN)
-            if tier == SafetyTier.YELLOW:
-                return SafetyInfo(
-                    tier=SafetyTier.YELLOW,
-                    label="Caution",
-                    warning=warning or "Windows service — may affect functionality.",
-                    can_kill=True,
-                )
-            return SafetyInfo(
-                tier=SafetyTier.GREEN,
-                label="Safe",
-                warning="",
-                can_kill=True,
-            )
+            return _with_warning(_DB_CAUTION_DEFAULT, warning)
+        elif _CATEGORY_TIERS.get(category, SafetyTier.GREEN) == SafetyTier.YELLOW:
+            return _with_warning(_SERVICE_DEFAULT, warning)
 
     # Default: unknown processes are green (user can kill)
-    return SafetyInfo(
-        tier=SafetyTier.GREEN,
-        label="Safe",
-        warning="",
-        can_kill=True,
-    )
+    return _SAFE_DEFAULT
+
+
+# Display color and indicator per tier
+_TIER_COLORS = {
+    SafetyTier.GREEN: "#4CAF50",
+    SafetyTier.YELLOW: "#FF9800",
+    SafetyTier.RED: "#F44336",
+}
+
+_TIER_EMOJIS = {
+    SafetyTier.GREEN: "🟢",
+    SafetyTier.YELLOW: "🟡",
+    SafetyTier.RED: "🔴",
+}
 
 
 def get_tier_color(tier: SafetyTier) -> str:
     """Get the hex color for a safety tier."""
-    return {
-        SafetyTier.GREEN: "#4CAF50",
-        SafetyTier.YELLOW: "#FF9800",
-        SafetyTier.RED: "#F44336",
-    }[tier]
+    return _TIER_COLORS[tier]
 
 
 def get_tier_emoji(tier: SafetyTier) -> str:
     """Get the emoji indicator for a safety tier."""
-    return {
-        SafetyTier.GREEN: "🟢",
-        SafetyTier.YELLOW: "🟡",
-        SafetyTier.RED: "🔴",
-    }[tier]
+    return _TIER_EMOJIS[tier]
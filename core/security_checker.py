@@ -3,13 +3,21 @@ Process Trust & Security — verifies digital signatures, detects suspicious pro
 """
 
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 from functools import lru_cache
 
 import psutil
 
+try:
+    from core import authenticode
+    _HAS_WINTRUST = authenticode.AVAILABLE
+except ImportError:
+    _HAS_WINTRUST = False
+
 
 @dataclass
 class SecurityInfo:
@@ -25,13 +33,6 @@ class SecurityInfo:
             self.risk_reasons = []
 
 
-# Normal locations for executables
-_NORMAL_PATHS = [
-    r"c:\windows",
-    r"c:\program files",
-    r"c:\program files (x86)",
-]
-
 # Suspicious locations
 _SUSPICIOUS_PATHS = [
     r"\temp",
@@ -44,6 +45,13 @@ _SUSPICIOUS_PATHS = [
     r"\$recycle.bin",
 ]
 
+# All suspicious locations matched in a single scan of the path
+_SUSPICIOUS_RE = re.compile("|".join(re.escape(p) for p in _SUSPICIOUS_PATHS))
+
+
+# Parallel signature checks in get_unsigned_processes (I/O-bound)
+_SIGNATURE_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
 
 class SecurityChecker:
     """Checks process security and trustworthiness."""
@@ -60,27 +68,29 @@ class SecurityChecker:
         if not exe_path or not os.path.isfile(exe_path):
             return False, ""
 
+        if _HAS_WINTRUST:
+            # In-process WinVerifyTrust — no PowerShell spawn per file
+            try:
+                return authenticode.verify_signature(exe_path)
+            except Exception:
+                return False, ""
+
         try:
-            # Use PowerShell to check Authenticode signature
+            # Fall back to PowerShell: one spawn reports both status and signer
             ps_cmd = (
-                f'(Get-AuthenticodeSignature "{exe_path}").Status -eq "Valid"'
+                f'$s = Get-AuthenticodeSignature "{exe_path}"; '
+                '$s.Status -eq "Valid"; $s.SignerCertificate.Subject'
             )
             result = subprocess.run(
                 ["powershell", "-NoProfile", "-Command", ps_cmd],
                 capture_output=True, text=True, timeout=10
             )
-            is_signed = result.stdout.strip().lower() == "true"
+            lines = result.stdout.strip().splitlines()
+            is_signed = bool(lines) and lines[0].strip().lower() == "true"
 
             signer = ""
-            if is_signed:
-                ps_cmd2 = (
-                    f'(Get-AuthenticodeSignature "{exe_path}").SignerCertificate.Subject'
-                )
-                result2 = subprocess.run(
-                    ["powershell", "-NoProfile", "-Command", ps_cmd2],
-                    capture_output=True, text=True, timeout=10
-                )
-                raw = result2.stdout.strip()
+            if is_signed and len(lines) > 1:
+                raw = lines[1].strip()
                 # Extract CN=... from the subject
                 if "CN=" in raw:
                     cn_start = raw.index("CN=") + 3
@@ -94,22 +104,17 @@ class SecurityChecker:
         except Exception:
             return False, ""
 
+    @lru_cache(maxsize=1024)
     def check_location(self, exe_path: str) -> tuple[bool, str]:
         """Check if executable is in a suspicious location."""
         if not exe_path:
             return False, ""
 
         path_lower = exe_path.lower()
-        for spath in _SUSPICIOUS_PATHS:
-            if spath in path_lower:
-                return True, f"Running from suspicious location: {os.path.dirname(exe_path)}"
-
-        # Check if in a normal location
-        in_normal = any(path_lower.startswith(np) for np in _NORMAL_PATHS)
-        if not in_normal:
-            # Not suspicious per se, just unusual
-            return False, ""
+        if _SUSPICIOUS_RE.search(path_lower):
+            return True, f"Running from suspicious location: {os.path.dirname(exe_path)}"
 
+        # Anything else — a normal install location or merely unusual — is not suspicious
         return False, ""
 
     def assess_risk(self, exe_path: str, proc_name: str = "") -> SecurityInfo:
@@ -149,7 +154,7 @@ class SecurityChecker:
 
     def get_unsigned_processes(self) -> list[dict]:
         """Get all running unsigned processes."""
-        unsigned = []
+        candidates = []
         seen_paths = set()
 
         for proc in psutil.process_iter(['pid', 'name', 'exe']):
@@ -157,14 +162,16 @@ class SecurityChecker:
                 exe = proc.info.get('exe')
                 if exe and exe not in seen_paths:
                     seen_paths.add(exe)
-                    is_signed, signer = self.check_signature(exe)
-                    if not is_signed:
-                        unsigned.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'exe': exe,
-                        })
+                    candidates.append((proc.info['pid'], proc.info['name'], exe))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
 
-        return unsigned
+        # Verify across files concurrently; check_signature is cached and thread-safe
+        with ThreadPoolExecutor(max_workers=_SIGNATURE_WORKERS) as pool:
+            results = list(pool.map(self.check_signature, [c[2] for c in candidates]))
+
+        return [
+            {'pid': pid, 'name': name, 'exe': exe}
+            for (pid, name, exe), (is_signed, _) in zip(candidates, results)
+            if not is_signed
+        ]
@@ -3,132 +3,199 @@ Startup Manager — lists, enables, and disables startup items.
 Sources: Registry Run keys, shell:startup folder, Task Scheduler.
 """
 
+import csv
+import ctypes
+import io
+import json
 import os
+import re
 import subprocess
 import winreg
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Optional
 
 
+# Logon/boot-triggered tasks as compact JSON: one PowerShell call instead of `schtasks /V` CSV
+_SCHEDULED_TASKS_PS = (
+    "[Console]::OutputEncoding = [Text.Encoding]::UTF8; "
+    "Get-ScheduledTask | Where-Object { $_.Triggers | Where-Object "
+    "{ $_.CimClass.CimClassName -match 'Logon|Boot' } } | ForEach-Object { "
+    "[pscustomobject]@{ Name = $_.TaskName; Path = $_.TaskPath; State = [string]$_.State; "
+    "Action = (($_.Actions | ForEach-Object { \"$($_.Execute) $($_.Arguments)\".Trim() }) -join '; ') } "
+    "} | ConvertTo-Json -Compress"
+)
+
+# Task Manager's per-entry enable state for Run keys: value data starting 02 = enabled, 03 = disabled
+_APPROVED_PATH = r"Software\Microsoft\Windows\CurrentVersion\Explorer\StartupApproved\Run"
+_APPROVED_ENABLED = b'\x02' + b'\x00' * 11
+_APPROVED_DISABLED = b'\x03' + b'\x00' * 11
+
+# Per-user and all-users startup folders, expanded once
+_STARTUP_DIRS = (
+    os.path.expandvars(r"%APPDATA%\Microsoft\Windows\Start Menu\Programs\Startup"),
+    os.path.expandvars(r"%ALLUSERSPROFILE%\Microsoft\Windows\Start Menu\Programs\Startup"),
+)
+
+# Impact keywords per tier, checked in priority order (first tier with a hit wins)
+_IMPACT_KEYWORDS = (
+    ("High", ('chrome', 'firefox', 'edge', 'teams', 'outlook', 'steam',
+              'discord', 'spotify', 'onedrive', 'dropbox', 'adobe',
+              'java', 'skype', 'zoom')),
+    ("Medium", ('update', 'helper', 'sync', 'monitor', 'tray', 'notify')),
+    ("Low", ('ctfmon', 'ime', 'input')),
+)
+
+# Keyword -> tier rank (0 = highest priority)
+_IMPACT_RANK = {
+    kw: rank for rank, (_, keywords) in enumerate(_IMPACT_KEYWORDS) for kw in keywords
+}
+
+# All keywords in one pattern, matched against the lowercased command (cheaper than
+# IGNORECASE in sre); the lookahead reports overlapping hits
+_IMPACT_RE = re.compile("(?=(" + "|".join(map(re.escape, _IMPACT_RANK)) + "))")
+
+
 @dataclass
 class StartupItem:
     name: str
     command: str
     location: str       # "registry_hkcu", "registry_hklm", "startup_folder", "task_scheduler"
     enabled: bool
-    impact: str = ""    # "High", "Medium", "Low", "None", "Unknown"
     description: str = ""
     publisher: str = ""
 
+    @cached_property
+    def impact(self) -> str:
+        """Startup impact: "High", "Medium", "Low", "None", "Unknown" (estimated on first access)."""
+        if self.location == "task_scheduler":
+            return "Medium"
+        return _estimate_impact(self.command)
+
 
 class StartupManager:
     """Manages Windows startup items."""
 
+    def __init__(self):
+        # Machine-wide Run entries can only be toggled when elevated, so they are skipped otherwise
+        try:
+            self.is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
+        except Exception:
+            self.is_admin = False
+
     def get_all_items(self) -> list[StartupItem]:
         """Collect all startup items from all sources."""
-        items = []
-        items.extend(self._get_registry_items(winreg.HKEY_CURRENT_USER, "registry_hkcu"))
-        items.extend(self._get_registry_items(winreg.HKEY_LOCAL_MACHINE, "registry_hklm"))
-        items.extend(self._get_startup_folder_items())
-        items.extend(self._get_scheduled_task_items())
+        # The sources are independent and I/O-bound, so enumerate them concurrently
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(self._get_registry_items, winreg.HKEY_CURRENT_USER, "registry_hkcu"),
+                pool.submit(self._get_startup_folder_items),
+                pool.submit(self._get_scheduled_task_items),
+            ]
+            if self.is_admin:
+                futures.insert(1, pool.submit(
+                    self._get_registry_items, winreg.HKEY_LOCAL_MACHINE, "registry_hklm"))
+            items = []
+            for future in futures:
+                items.extend(future.result())
         return items
 
+    @staticmethod
+    def _enum_values(hive, path: str):
+        """Yield (name, value, type) for every value under a registry key, if it exists."""
+        try:
+            key = winreg.OpenKey(hive, path, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY)
+        except FileNotFoundError:
+            return
+        with key:
+            for i in range(winreg.QueryInfoKey(key)[1]):
+                try:
+                    value = winreg.EnumValue(key, i)
+                except OSError:
+                    return  # a value was deleted after the count was read
+                yield value
+
     def _get_registry_items(self, hive, location_label: str) -> list[StartupItem]:
         """Read startup entries from registry Run keys."""
         items = []
         run_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
-        # Enabled items
-        try:
-            key = winreg.OpenKey(hive, run_path, 0, winreg.KEY_READ)
-            i = 0
-            while True:
-                try:
-                    name, value, _ = winreg.EnumValue(key, i)
-                    items.append(StartupItem(
-                        name=name,
-                        command=value,
-                        location=location_label,
-                        enabled=True,
-                        impact=self._estimate_impact(value),
-                    ))
-                    i += 1
-                except OSError:
-                    break
-            winreg.CloseKey(key)
-        except FileNotFoundError:
-            pass
-
-        # Disabled items (stored by Windows in a separate key)
+        # Enabled items, then disabled items (stored by Windows in a separate key)
         disabled_path = run_path.replace("\\Run", "\\Run-Disabled")
-        try:
-            key = winreg.OpenKey(hive, disabled_path, 0, winreg.KEY_READ)
-            i = 0
-            while True:
-                try:
-                    name, value, _ = winreg.EnumValue(key, i)
-                    items.append(StartupItem(
-                        name=name,
-                        command=value,
-                        location=location_label,
-                        enabled=False,
-                        impact=self._estimate_impact(value),
-                    ))
-                    i += 1
-                except OSError:
-                    break
-            winreg.CloseKey(key)
-        except FileNotFoundError:
-            pass
+        for path, enabled in ((run_path, True), (disabled_path, False)):
+            for name, value, _ in self._enum_values(hive, path):
+                items.append(StartupItem(
+                    name=name,
+                    command=value,
+                    location=location_label,
+                    enabled=enabled,
+                ))
 
         # Also check the approved list used by Task Manager
-        approved_path = r"Software\Microsoft\Windows\CurrentVersion\Explorer\StartupApproved\Run"
-        try:
-            key = winreg.OpenKey(hive, approved_path, 0, winreg.KEY_READ)
-            i = 0
-            while True:
-                try:
-                    name, value, vtype = winreg.EnumValue(key, i)
-                    # If first byte is not 02, the item is disabled
-                    if isinstance(value, bytes) and len(value) >= 1:
-                        is_enabled = value[0] == 0x02
-                        # Find matching item and update enabled status
-                        for item in items:
-                            if item.name == name:
-                                item.enabled = is_enabled
-                                break
-                    i += 1
-                except OSError:
-                    break
-            winreg.CloseKey(key)
-        except FileNotFoundError:
-            pass
+        by_name: dict[str, StartupItem] = {}
+        for item in items:
+            by_name.setdefault(item.name, item)
+        for name, value, _ in self._enum_values(hive, _APPROVED_PATH):
+            # If first byte is not 02, the item is disabled
+            if isinstance(value, bytes) and len(value) >= 1:
+                item = by_name.get(name)
+                if item:
+                    item.enabled = value[0] == 0x02
 
         return items
 
     def _get_startup_folder_items(self) -> list[StartupItem]:
         """Read startup entries from the startup folder."""
         items = []
-        startup_dirs = [
-            os.path.expandvars(r"%APPDATA%\Microsoft\Windows\Start Menu\Programs\Startup"),
-            os.path.expandvars(r"%ALLUSERSPROFILE%\Microsoft\Windows\Start Menu\Programs\Startup"),
-        ]
-        for folder in startup_dirs:
-            if os.path.isdir(folder):
-                for fname in os.listdir(folder):
-                    fpath = os.path.join(folder, fname)
-                    if os.path.isfile(fpath):
-                        items.append(StartupItem(
-                            name=fname,
-                            command=fpath,
-                            location="startup_folder",
-                            enabled=True,
-                            impact=self._estimate_impact(fpath),
-                        ))
+        for folder in _STARTUP_DIRS:
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            items.append(StartupItem(
+                                name=entry.name,
+                                command=entry.path,
+                                location="startup_folder",
+                                enabled=True,
+                            ))
+            except OSError:
+                continue
         return items
 
     def _get_scheduled_task_items(self) -> list[StartupItem]:
-        """Get scheduled tasks that run at logon."""
+        """Get scheduled tasks that run at logon or boot."""
+        try:
+            result = subprocess.run(
+                ["powershell", "-NoProfile", "-Command", _SCHEDULED_TASKS_PS],
+                capture_output=True, text=True, timeout=15,
+                encoding='utf-8', errors='replace'
+            )
+            if result.returncode != 0:
+                return self._get_scheduled_task_items_schtasks()
+            output = result.stdout.strip()
+            records = json.loads(output) if output else []
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return self._get_scheduled_task_items_schtasks()
+
+        # ConvertTo-Json emits a bare object when there is a single task
+        if isinstance(records, dict):
+            records = [records]
+
+        items = []
+        for rec in records:
+            task_name = f"{rec.get('Path') or ''}{rec.get('Name') or ''}"
+            items.append(StartupItem(
+                name=rec.get('Name') or "",
+                command=rec.get('Action') or "",
+                location="task_scheduler",
+                enabled=(rec.get('State') or "").lower() != "disabled",
+                description=f"Scheduled task: {task_name}",
+            ))
+        return items
+
+    def _get_scheduled_task_items_schtasks(self) -> list[StartupItem]:
+        """Fallback: parse `schtasks /Query /V` CSV for tasks that run at logon."""
         items = []
         try:
             result = subprocess.run(
@@ -137,84 +204,70 @@ class StartupManager:
                 encoding='utf-8', errors='replace'
             )
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:
-                    headers = lines[0].replace('"', '').split(',')
+                rows = csv.reader(io.StringIO(result.stdout))
+                headers = next(rows, None)
+                if headers:
                     name_idx = next((i for i, h in enumerate(headers) if 'TaskName' in h), 0)
                     trigger_idx = next((i for i, h in enumerate(headers) if 'Trigger' in h or 'Start' in h), -1)
                     action_idx = next((i for i, h in enumerate(headers) if 'Task To Run' in h), -1)
                     status_idx = next((i for i, h in enumerate(headers) if 'Status' in h), -1)
+                    min_len = max(name_idx, trigger_idx, action_idx, status_idx)
 
-                    for line in lines[1:]:
-                        parts = line.replace('"', '').split(',')
-                        if len(parts) > max(name_idx, trigger_idx, action_idx, status_idx):
-                            trigger = parts[trigger_idx] if trigger_idx >= 0 else ""
-                            if "logon" in trigger.lower() or "startup" in trigger.lower():
-                                task_name = parts[name_idx]
-                                action = parts[action_idx] if action_idx >= 0 else ""
-                                status = parts[status_idx] if status_idx >= 0 else ""
-                                enabled = "disabled" not in status.lower()
-                                items.append(StartupItem(
-                                    name=task_name.split('\\')[-1],
-                                    command=action,
-                                    location="task_scheduler",
-                                    enabled=enabled,
-                                    impact="Medium",
-                                    description=f"Scheduled task: {task_name}",
-                                ))
+                    for row in rows:
+                        if len(row) <= min_len:
+                            continue
+                        trigger = row[trigger_idx].lower() if trigger_idx >= 0 else ""
+                        if "logon" not in trigger and "startup" not in trigger:
+                            continue
+                        task_name = row[name_idx]
+                        action = row[action_idx] if action_idx >= 0 else ""
+                        status = row[status_idx] if status_idx >= 0 else ""
+                        items.append(StartupItem(
+                            name=task_name.split('\\')[-1],
+                            command=action,
+                            location="task_scheduler",
+                            enabled="disabled" not in status.lower(),
+                            description=f"Scheduled task: {task_name}",
+                        ))
         except Exception:
             pass
         return items
 
-    def _estimate_impact(self, command: str) -> str:
-        """Estimate startup impact based on the command."""
-        cmd_lower = command.lower()
-        high_impact = ['chrome', 'firefox', 'edge', 'teams', 'outlook', 'steam',
-                       'discord', 'spotify', 'onedrive', 'dropbox', 'adobe',
-                       'java', 'skype', 'zoom']
-        medium_impact = ['update', 'helper', 'sync', 'monitor', 'tray', 'notify']
-        low_impact = ['ctfmon', 'ime', 'input']
-
-        for kw in high_impact:
-            if kw in cmd_lower:
-                return "High"
-        for kw in medium_impact:
-            if kw in cmd_lower:
-                return "Medium"
-        for kw in low_impact:
-            if kw in cmd_lower:
-                return "Low"
-        return "Unknown"
-
     def toggle_item(self, item: StartupItem, enable: bool) -> tuple[bool, str]:
         """Enable or disable a startup item."""
         if item.location.startswith("registry_"):
-            return self._toggle_registry_item(item, enable)
+            return self.toggle_items([item], enable)[0]
         elif item.location == "startup_folder":
             return self._toggle_folder_item(item, enable)
         elif item.location == "task_scheduler":
             return self._toggle_task_item(item, enable)
         return False, f"Unknown location: {item.location}"
 
-    def _toggle_registry_item(self, item: StartupItem, enable: bool) -> tuple[bool, str]:
-        """Toggle a registry startup item via the StartupApproved key."""
-        hive = (winreg.HKEY_CURRENT_USER if item.location == "registry_hkcu"
-                else winreg.HKEY_LOCAL_MACHINE)
-        approved_path = r"Software\Microsoft\Windows\CurrentVersion\Explorer\StartupApproved\Run"
-        try:
-            key = winreg.OpenKey(hive, approved_path, 0, winreg.KEY_ALL_ACCESS)
-            if enable:
-                # Enabled = starts with 02
-                data = b'\x02' + b'\x00' * 11
+    def toggle_items(self, items: list[StartupItem], enable: bool) -> list[tuple[bool, str]]:
+        """Enable or disable several startup items, opening each hive's StartupApproved key once."""
+        results: dict[int, tuple[bool, str]] = {}
+        by_hive: dict[int, list[int]] = {}
+        for i, item in enumerate(items):
+            if item.location.startswith("registry_"):
+                hive = (winreg.HKEY_CURRENT_USER if item.location == "registry_hkcu"
+                        else winreg.HKEY_LOCAL_MACHINE)
+                by_hive.setdefault(hive, []).append(i)
             else:
-                # Disabled = starts with 03
-                data = b'\x03' + b'\x00' * 11
-            winreg.SetValueEx(key, item.name, 0, winreg.REG_BINARY, data)
-            winreg.CloseKey(key)
-            state = "enabled" if enable else "disabled"
-            return True, f"Startup entry '{item.name}' {state}."
-        except Exception as e:
-            return False, str(e)
+                results[i] = self.toggle_item(item, enable)
+
+        data = _APPROVED_ENABLED if enable else _APPROVED_DISABLED
+        state = "enabled" if enable else "disabled"
+        for hive, indices in by_hive.items():
+            try:
+                with winreg.OpenKey(hive, _APPROVED_PATH, 0,
+                                    winreg.KEY_ALL_ACCESS | winreg.KEY_WOW64_64KEY) as key:
+                    for i in indices:
+                        winreg.SetValueEx(key, items[i].name, 0, winreg.REG_BINARY, data)
+                        results[i] = (True, f"Startup entry '{items[i].name}' {state}.")
+            except Exception as e:
+                for i in indices:
+                    results.setdefault(i, (False, str(e)))
+        return [results[i] for i in range(len(items))]
 
     def _toggle_folder_item(self, item: StartupItem, enable: bool) -> tuple[bool, str]:
         """Toggle a startup folder item by renaming."""
@@ -248,3 +301,14 @@ class StartupManager:
             return False, result.stderr.strip()
         except Exception as e:
             return False, str(e)
+
+
+@lru_cache(maxsize=1024)
+def _estimate_impact(command: str) -> str:
+    """Map a startup command to its impact tier in a single pass over the keyword pattern."""
+    best = len(_IMPACT_KEYWORDS)
+    for match in _IMPACT_RE.finditer(command.lower()):
+        best = min(best, _IMPACT_RANK[match.group(1)])
+        if best == 0:
+            break
+    return _IMPACT_KEYWORDS[best][0] if best < len(_IMPACT_KEYWORDS) else "Unknown"
@@ -5,12 +5,25 @@ Supports: disabling services, startup entries, scheduled tasks, and IFEO blockin
 
 import json
 import os
+import queue
 import subprocess
+import threading
+import time
 import winreg
 from typing import Optional
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 
+try:
+    import orjson  # Optional: faster encode/decode of the suppression log
+except ImportError:
+    orjson = None
+
+try:
+    import win32service  # Optional: configure services in-process instead of via sc.exe
+except ImportError:
+    win32service = None
+
 
 @dataclass
 class SuppressionEntry:
@@ -20,60 +33,224 @@ class SuppressionEntry:
     detail: str = ""  # service name, task name, registry key, etc.
     created: str = ""
     active: bool = True
+    hive: str = ""            # "startup": "HKCU" or "HKLM" the value was removed from
+    original_value: str = ""  # "startup": command to write back on restore
+
 
+# Run key hives that startup entries can be removed from, by stored label
+_RUN_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
+_RUN_HIVES = {
+    "HKCU": winreg.HKEY_CURRENT_USER,
+    "HKLM": winreg.HKEY_LOCAL_MACHINE,
+}
 
+# Append-only log: one entry or tombstone record per line
 _SUPPRESSION_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "resources", "suppressions.jsonl"
+)
+
+# Pre-JSONL storage, migrated on first load
+_LEGACY_SUPPRESSION_FILE = os.path.join(
     os.path.dirname(os.path.dirname(__file__)), "resources", "suppressions.json"
 )
 
+# Task/service statements for the PowerShell host; each prints one status line ("OK" or "ERR <message>")
+_PS_STATUS = "-ErrorAction Stop | Out-Null; 'OK' }} catch {{ 'ERR ' + ($_.Exception.Message -replace '\\s+', ' ') }}"
+_PS_ENABLE_TASK = "try {{ Enable-ScheduledTask -TaskPath '{path}' -TaskName '{name}' " + _PS_STATUS
+_PS_DISABLE_TASK = "try {{ Disable-ScheduledTask -TaskPath '{path}' -TaskName '{name}' " + _PS_STATUS
+_PS_ENABLE_SERVICE = "try {{ Set-Service -Name '{name}' -StartupType Automatic " + _PS_STATUS
+
+# Marks the end of one command's output from the persistent PowerShell host
+_PS_DONE = "==DONE=="
+
+# Seconds allowed per statement before the PowerShell host is considered stuck
+_PS_TIMEOUT = 10
+
+
+def _ps_quote(value: str) -> str:
+    """Escape a value for use inside a single-quoted PowerShell string."""
+    return value.replace("'", "''")
+
+
+def _dumps(record) -> str:
+    """Serialize one log record (a dict or SuppressionEntry) as a JSON line."""
+    if orjson:
+        return orjson.dumps(record).decode() + "\n"  # dataclasses are encoded natively
+    if not isinstance(record, dict):
+        record = asdict(record)
+    return json.dumps(record) + "\n"
+
+
+_loads = orjson.loads if orjson else json.loads
+
+
+def _task_statement(template: str, task_name: str) -> str:
+    """Fill a task statement template from a full task name such as "\\Folder\\Task"."""
+    head, _, name = task_name.rpartition("\\")
+    return template.format(path=_ps_quote(head + "\\"), name=_ps_quote(name))
+
 
 class SuppressionManager:
     """Manages process suppression rules."""
 
+    # Folded suppression log shared across instances: (st_mtime_ns, live records, record count)
+    _file_cache: Optional[tuple[int, list[dict], int]] = None
+
     def __init__(self):
         self.entries: list[SuppressionEntry] = []
+        self._index: dict[tuple[str, str], list[SuppressionEntry]] = {}  # (method, detail) -> entries
+        self._record_count = 0  # lines in the log, including superseded ones
+        self._defer_save = False  # batch operations persist once at the end
+        self._ps: Optional[subprocess.Popen] = None  # started on first task operation
+        self._ps_lines: Optional[queue.Queue] = None  # host stdout lines, None at EOF
+        self._ps_lock = threading.Lock()
         self._load()
 
     def _load(self):
-        """Load suppression entries from disk."""
+        """Load suppression entries from disk, reusing the parsed log while it is unchanged."""
+        try:
+            mtime = os.stat(_SUPPRESSION_FILE).st_mtime_ns
+        except FileNotFoundError:
+            self._load_legacy()
+            return
+        cached = SuppressionManager._file_cache
+        if cached is not None and cached[0] == mtime:
+            _, data, self._record_count = cached
+        else:
+            data, self._record_count = self._read_log()
+            SuppressionManager._file_cache = (mtime, data, self._record_count)
+        self.entries = [SuppressionEntry(**e) for e in data]
+        self._reindex()
+
+    @staticmethod
+    def _read_log() -> tuple[list[dict], int]:
+        """Fold the log's entry and tombstone records into the live record list."""
+        records: list[Optional[dict]] = []
+        positions: dict[tuple, list[int]] = {}
+        count = 0
+        with open(_SUPPRESSION_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = _loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn trailing append
+                count += 1
+                if "_tombstone" in record:
+                    key = (record.get("method"), record["_tombstone"])
+                    if "hive" in record:
+                        # Startup tombstones name the hive, leaving the other hive's entry live
+                        kept = []
+                        for pos in positions.pop(key, ()):
+                            if records[pos].get("hive", "") == record["hive"]:
+                                records[pos] = None
+                            else:
+                                kept.append(pos)
+                        if kept:
+                            positions[key] = kept
+                    else:
+                        for pos in positions.pop(key, ()):
+                            records[pos] = None
+                else:
+                    key = (record.get("method"), record.get("detail"))
+                    positions.setdefault(key, []).append(len(records))
+                    records.append(record)
+        return [r for r in records if r is not None], count
+
+    def _load_legacy(self):
+        """Migrate entries from the old single-document JSON file, if present."""
         try:
-            with open(_SUPPRESSION_FILE, "r") as f:
-                data = json.load(f)
-                self.entries = [SuppressionEntry(**e) for e in data]
+            with open(_LEGACY_SUPPRESSION_FILE, "r", encoding="utf-8") as f:
+                self.entries = [SuppressionEntry(**e) for e in _loads(f.read())]
         except (FileNotFoundError, json.JSONDecodeError):
             self.entries = []
+            return
+        self._reindex()
+        self._save()
 
-    def _save(self):
-        """Persist suppression entries to disk."""
-        data = []
+    def _reindex(self):
+        """Rebuild the (method, detail) lookup from the entry list."""
+        self._index = {}
         for e in self.entries:
-            data.append({
-                "process_name": e.process_name,
-                "exe_path": e.exe_path,
-                "method": e.method,
-                "detail": e.detail,
-                "created": e.created,
-                "active": e.active,
-            })
+            self._index.setdefault((e.method, e.detail), []).append(e)
+
+    def _remember(self):
+        """Refresh the shared cache after this instance rewrote the log."""
+        SuppressionManager._file_cache = (
+            os.stat(_SUPPRESSION_FILE).st_mtime_ns,
+            [asdict(e) for e in self.entries],
+            self._record_count,
+        )
+
+    def _append(self, record):
+        """Append one record to the log."""
+        os.makedirs(os.path.dirname(_SUPPRESSION_FILE), exist_ok=True)
+        with open(_SUPPRESSION_FILE, "a", encoding="utf-8") as f:
+            f.write(_dumps(record))
+        self._record_count += 1
+        # Keep appends O(1): the next _load re-folds the log instead of this
+        # call snapshotting every entry into the shared cache
+        SuppressionManager._file_cache = None
+
+    def _add(self, entry: SuppressionEntry):
+        """Record a new suppression entry (persisted first, so a failed write changes nothing)."""
+        self._append(entry)
+        self.entries.append(entry)
+        self._index.setdefault((entry.method, entry.detail), []).append(entry)
+
+    def _remove(self, method: str, detail: str):
+        """Drop all entries matching method/detail."""
+        removed = self._index.pop((method, detail), None)
+        if not removed:
+            return
+        for e in removed:
+            self.entries.remove(e)
+        self._log_removal({"_tombstone": detail, "method": method})
+
+    def _remove_entry(self, entry: SuppressionEntry):
+        """Drop one startup entry, keeping any entry for the same value name in the other hive."""
+        key = (entry.method, entry.detail)
+        bucket = self._index.get(key, [])
+        if entry not in bucket:
+            return
+        bucket.remove(entry)
+        if not bucket:
+            del self._index[key]
+        self.entries.remove(entry)
+        self._log_removal({"_tombstone": entry.detail, "method": entry.method, "hive": entry.hive})
+
+    def _log_removal(self, tombstone: dict):
+        """Append a tombstone, compacting once tombstones dominate the log."""
+        if self._defer_save:
+            return
+        self._append(tombstone)
+        if self._record_count > 2 * len(self.entries):
+            self._save()
+
+    def _save(self):
+        """Rewrite the log with only the live entries, atomically."""
         os.makedirs(os.path.dirname(_SUPPRESSION_FILE), exist_ok=True)
-        with open(_SUPPRESSION_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a sibling temp file and swap it in so a crash never leaves a torn file
+        tmp_path = _SUPPRESSION_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(map(_dumps, self.entries)))
+        os.replace(tmp_path, _SUPPRESSION_FILE)
+        self._record_count = len(self.entries)
+        self._remember()
 
     def get_entries(self) -> list[SuppressionEntry]:
         return list(self.entries)
 
+    def is_suppressed(self, method: str, detail: str) -> bool:
+        """Check whether a suppression entry exists for method/detail."""
+        return (method, detail) in self._index
+
     def disable_service(self, service_name: str, process_name: str = "") -> tuple[bool, str]:
         """Disable a Windows service to prevent respawn."""
         try:
-            result = subprocess.run(
-                ["sc", "config", service_name, "start=", "disabled"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                subprocess.run(
-                    ["sc", "stop", service_name],
-                    capture_output=True, text=True, timeout=10
-                )
+            error = self._configure_service(service_name, "disabled", stop=True)
+            if error is None:
                 entry = SuppressionEntry(
                     process_name=process_name or service_name,
                     method="service",
@@ -81,52 +258,81 @@ class SuppressionManager:
                     created=datetime.now().isoformat(),
                     active=True,
                 )
-                self.entries.append(entry)
-                self._save()
+                self._add(entry)
                 return True, f"Service '{service_name}' disabled."
             else:
-                return False, f"Failed: {result.stderr.strip()}"
+                return False, f"Failed: {error}"
         except Exception as e:
             return False, str(e)
 
     def enable_service(self, service_name: str) -> tuple[bool, str]:
         """Re-enable a disabled service."""
         try:
-            result = subprocess.run(
-                ["sc", "config", service_name, "start=", "auto"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                self.entries = [
-                    e for e in self.entries
-                    if not (e.method == "service" and e.detail == service_name)
-                ]
-                self._save()
+            error = self._configure_service(service_name, "auto")
+            if error is None:
+                self._remove("service", service_name)
                 return True, f"Service '{service_name}' re-enabled."
             else:
-                return False, f"Failed: {result.stderr.strip()}"
+                return False, f"Failed: {error}"
         except Exception as e:
             return False, str(e)
 
+    @staticmethod
+    def _configure_service(service_name: str, start: str, stop: bool = False) -> Optional[str]:
+        """Set a service's start type ("auto"/"disabled"), optionally stopping it; returns an error or None."""
+        if win32service is None:
+            result = subprocess.run(
+                ["sc", "config", service_name, "start=", start],
+                capture_output=True, text=True, timeout=10
+            )
+            if result.returncode != 0:
+                return result.stderr.strip()
+            if stop:
+                subprocess.run(
+                    ["sc", "stop", service_name],
+                    capture_output=True, text=True, timeout=10
+                )
+            return None
+
+        start_type = (win32service.SERVICE_DISABLED if start == "disabled"
+                      else win32service.SERVICE_AUTO_START)
+        access = win32service.SERVICE_CHANGE_CONFIG | (win32service.SERVICE_STOP if stop else 0)
+        try:
+            scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+            try:
+                svc = win32service.OpenService(scm, service_name, access)
+                try:
+                    win32service.ChangeServiceConfig(
+                        svc, win32service.SERVICE_NO_CHANGE, start_type,
+                        win32service.SERVICE_NO_CHANGE, None, None, 0, None, None, None, None
+                    )
+                    if stop:
+                        try:
+                            win32service.ControlService(svc, win32service.SERVICE_CONTROL_STOP)
+                        except win32service.error:
+                            pass  # not running
+                finally:
+                    win32service.CloseServiceHandle(svc)
+            finally:
+                win32service.CloseServiceHandle(scm)
+        except win32service.error as e:
+            return e.strerror
+        return None
+
     def disable_startup_entry(self, name: str, location: str = "registry",
                               process_name: str = "") -> tuple[bool, str]:
         """Disable a startup entry."""
         try:
             if location == "registry":
-                for hive, path in [
-                    (winreg.HKEY_CURRENT_USER,
-                     r"Software\Microsoft\Windows\CurrentVersion\Run"),
-                    (winreg.HKEY_LOCAL_MACHINE,
-                     r"Software\Microsoft\Windows\CurrentVersion\Run"),
-                ]:
+                for hive_label, hive in _RUN_HIVES.items():
                     try:
-                        key = winreg.OpenKey(hive, path, 0, winreg.KEY_ALL_ACCESS)
+                        key = winreg.OpenKey(hive, _RUN_PATH, 0, winreg.KEY_ALL_ACCESS)
                         value, _ = winreg.QueryValueEx(key, name)
                         winreg.DeleteValue(key, name)
                         winreg.CloseKey(key)
 
                         # Store in disabled run key for restore
-                        disabled_path = path.replace("\\Run", "\\Run-Disabled")
+                        disabled_path = _RUN_PATH.replace("\\Run", "\\Run-Disabled")
                         try:
                             dkey = winreg.CreateKey(hive, disabled_path)
                             winreg.SetValueEx(dkey, name, 0, winreg.REG_SZ, value)
@@ -137,12 +343,13 @@ class SuppressionManager:
                         entry = SuppressionEntry(
                             process_name=process_name or name,
                             method="startup",
-                            detail=f"{name}|{location}|{value}",
+                            detail=name,
                             created=datetime.now().isoformat(),
                             active=True,
+                            hive=hive_label,
+                            original_value=value,
                         )
-                        self.entries.append(entry)
-                        self._save()
+                        self._add(entry)
                         return True, f"Startup entry '{name}' disabled."
                     except FileNotFoundError:
                         continue
@@ -158,11 +365,8 @@ class SuppressionManager:
                                process_name: str = "") -> tuple[bool, str]:
         """Disable a scheduled task."""
         try:
-            result = subprocess.run(
-                ["schtasks", "/Change", "/TN", task_name, "/Disable"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
+            ok, error = self._run_powershell_batch([_task_statement(_PS_DISABLE_TASK, task_name)])[0]
+            if ok:
                 entry = SuppressionEntry(
                     process_name=process_name or task_name,
                     method="task",
@@ -170,30 +374,22 @@ class SuppressionManager:
                     created=datetime.now().isoformat(),
                     active=True,
                 )
-                self.entries.append(entry)
-                self._save()
+                self._add(entry)
                 return True, f"Scheduled task '{task_name}' disabled."
             else:
-                return False, f"Failed: {result.stderr.strip()}"
+                return False, f"Failed: {error}"
         except Exception as e:
             return False, str(e)
 
     def enable_scheduled_task(self, task_name: str) -> tuple[bool, str]:
         """Re-enable a scheduled task."""
         try:
-            result = subprocess.run(
-                ["schtasks", "/Change", "/TN", task_name, "/Enable"],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                self.entries = [
-                    e for e in self.entries
-                    if not (e.method == "task" and e.detail == task_name)
-                ]
-                self._save()
+            ok, error = self._run_powershell_batch([_task_statement(_PS_ENABLE_TASK, task_name)])[0]
+            if ok:
+                self._remove("task", task_name)
                 return True, f"Scheduled task '{task_name}' re-enabled."
             else:
-                return False, f"Failed: {result.stderr.strip()}"
+                return False, f"Failed: {error}"
         except Exception as e:
             return False, str(e)
 
@@ -216,8 +412,7 @@ class SuppressionManager:
                 created=datetime.now().isoformat(),
                 active=True,
             )
-            self.entries.append(entry)
-            self._save()
+            self._add(entry)
             return True, f"Process '{exe_name}' blocked via IFEO."
         except PermissionError:
             return False, "Access denied. Run as Administrator."
@@ -235,11 +430,7 @@ class SuppressionManager:
                 pass
             winreg.CloseKey(key)
 
-            self.entries = [
-                e for e in self.entries
-                if not (e.method == "ifeo" and e.detail == exe_name)
-            ]
-            self._save()
+            self._remove("ifeo", exe_name)
             return True, f"IFEO block removed for '{exe_name}'."
         except Exception as e:
             return False, str(e)
@@ -257,30 +448,137 @@ class SuppressionManager:
         elif entry.method == "ifeo":
             return self.unblock_ifeo(entry.detail)
         elif entry.method == "startup":
-            parts = entry.detail.split("|")
-            if len(parts) >= 3:
-                name, location, value = parts[0], parts[1], "|".join(parts[2:])
+            if entry.hive:
+                name, value = entry.detail, entry.original_value
+                hives = (_RUN_HIVES[entry.hive],)
+            else:
+                # Entries recorded before hive/original_value existed pack "name|location|value"
+                parts = entry.detail.split("|")
+                if len(parts) < 3:
+                    return False, "Cannot restore startup entry — missing data."
+                name, value = parts[0], "|".join(parts[2:])
+                hives = tuple(_RUN_HIVES.values())
+            error = "Cannot restore startup entry — missing data."
+            for hive in hives:
                 try:
-                    for hive in [winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE]:
-                        path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-                        try:
-                            key = winreg.OpenKey(hive, path, 0, winreg.KEY_ALL_ACCESS)
-                            winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
-                            winreg.CloseKey(key)
-                            self.entries.pop(index)
-                            self._save()
-                            return True, f"Startup entry '{name}' restored."
-                        except Exception:
-                            continue
-                except Exception as e:
-                    return False, str(e)
-            return False, "Cannot restore startup entry — missing data."
+                    with winreg.OpenKey(hive, _RUN_PATH, 0, winreg.KEY_ALL_ACCESS) as key:
+                        winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
+                except OSError as e:
+                    error = str(e)
+                    continue
+                self._remove_entry(entry)
+                return True, f"Startup entry '{name}' restored."
+            return False, error
         return False, f"Unknown method: {entry.method}"
 
     def restore_all(self) -> list[tuple[bool, str]]:
         """Restore all active suppression entries."""
+        active = [e for e in reversed(self.entries) if e.active]
+        # Services only need the PowerShell batch when they cannot be configured in-process
+        batched_methods = ("task",) if win32service is not None else ("task", "service")
+        batched = list(dict.fromkeys(
+            (e.method, e.detail) for e in active if e.method in batched_methods
+        ))
+        statements = [
+            _task_statement(_PS_ENABLE_TASK, detail) if method == "task"
+            else _PS_ENABLE_SERVICE.format(name=_ps_quote(detail))
+            for method, detail in batched
+        ]
+        # The PowerShell host re-enables every task and service in one round trip
+        outcomes = dict(zip(batched, self._run_powershell_batch(statements)))
+
         results = []
-        for i in range(len(self.entries) - 1, -1, -1):
-            if self.entries[i].active:
-                results.append(self.restore_entry(i))
+        done = set()
+        self._defer_save = True
+        try:
+            for entry in active:
+                key = (entry.method, entry.detail)
+                # Startup entries with the same value name in both hives are restored separately
+                done_key = key + (entry.hive,)
+                if done_key in done:
+                    continue
+                done.add(done_key)
+                if key in outcomes:
+                    ok, error = outcomes[key]
+                    if not ok:
+                        results.append((False, f"Failed: {error}"))
+                        continue
+                    self._remove(*key)
+                    if entry.method == "task":
+                        results.append((True, f"Scheduled task '{entry.detail}' re-enabled."))
+                    else:
+                        results.append((True, f"Service '{entry.detail}' re-enabled."))
+                elif entry in self._index.get(key, ()):
+                    results.append(self.restore_entry(self.entries.index(entry)))
+        finally:
+            self._defer_save = False
+            self._save()
         return results
+
+    def _run_powershell_batch(self, statements: list[str]) -> list[tuple[bool, str]]:
+        """Run status-printing PowerShell statements on the persistent host."""
+        if not statements:
+            return []
+        try:
+            lines = self._ps_exec("\n".join(statements), _PS_TIMEOUT * len(statements))
+        except (OSError, ValueError) as e:
+            return [(False, str(e))] * len(statements)
+        lines = [l.strip() for l in lines if l.strip()]
+        if len(lines) != len(statements):
+            return [(False, "Unexpected PowerShell output.")] * len(statements)
+        return [(l == "OK", l[4:]) for l in lines]
+
+    def _ps_exec(self, command: str, timeout: float) -> list[str]:
+        """Send one command to the long-lived PowerShell process and collect its output lines."""
+        with self._ps_lock:
+            if self._ps is None or self._ps.poll() is not None:
+                self._ps = subprocess.Popen(
+                    ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    text=True, encoding='utf-8', errors='replace'
+                )
+                self._ps_lines = queue.Queue()
+                threading.Thread(
+                    target=self._pump_lines, args=(self._ps.stdout, self._ps_lines), daemon=True
+                ).start()
+                self._ps.stdin.write("[Console]::OutputEncoding = [Text.Encoding]::UTF8\n")
+            self._ps.stdin.write(f"{command}\nWrite-Output '{_PS_DONE}'\n")
+            self._ps.stdin.flush()
+            deadline = time.monotonic() + timeout
+            out = []
+            while True:
+                try:
+                    line = self._ps_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    # Stuck cmdlet or silent host: kill it so the next call starts fresh
+                    self._ps.kill()
+                    self._ps = None
+                    raise OSError("PowerShell host timed out.")
+                if line is None:
+                    # EOF before the marker: the host died; start a fresh one next time
+                    self._ps = None
+                    raise OSError("PowerShell host exited unexpectedly.")
+                if line.strip() == _PS_DONE:
+                    return out
+                out.append(line)
+
+    @staticmethod
+    def _pump_lines(stdout, lines: queue.Queue):
+        """Forward the host's stdout lines to a queue so reads can time out; None marks EOF."""
+        try:
+            for line in stdout:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put(None)
+
+    def close(self):
+        """Shut down the persistent PowerShell host, if running."""
+        with self._ps_lock:
+            if self._ps is not None and self._ps.poll() is None:
+                try:
+                    self._ps.stdin.close()
+                    self._ps.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._ps.kill()
+            self._ps = None
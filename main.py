@@ -5,14 +5,22 @@ Enhanced Task Manager — Entry point with admin elevation.
 import sys
 import os
 import ctypes
+from typing import Optional
+
+
+# Elevation cannot change within a process, so the check runs once
+_IS_ADMIN: Optional[bool] = None
 
 
 def is_admin() -> bool:
     """Check if the current process has admin privileges."""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except Exception:
-        return False
+    global _IS_ADMIN
+    if _IS_ADMIN is None:
+        try:
+            _IS_ADMIN = ctypes.windll.shell32.IsUserAnAdmin() != 0
+        except Exception:
+            _IS_ADMIN = False
+    return _IS_ADMIN
 
 
 def run_as_admin():
@@ -43,18 +51,24 @@ def main():
     # Set up high DPI scaling
     os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 
+    import importlib
+    from concurrent.futures import ThreadPoolExecutor
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtCore import Qt
     from PyQt6.QtGui import QIcon
 
-    app = QApplication(sys.argv)
-    app.setApplicationName("Enhanced Task Manager")
-    app.setOrganizationName("EnhancedTaskManager")
+    # Import the UI and core modules in the background while QApplication initializes
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        main_window_module = pool.submit(importlib.import_module, "ui.main_window")
+
+        app = QApplication(sys.argv)
+        app.setApplicationName("Enhanced Task Manager")
+        app.setOrganizationName("EnhancedTaskManager")
 
-    # Prevent quit on last window close (we use system tray)
-    app.setQuitOnLastWindowClosed(False)
+        # Prevent quit on last window close (we use system tray)
+        app.setQuitOnLastWindowClosed(False)
 
-    from ui.main_window import MainWindow
+        MainWindow = main_window_module.result().MainWindow
     window = MainWindow()
 
     # Override close to allow actual quit from tray
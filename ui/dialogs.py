@@ -2,6 +2,9 @@
 Dialog windows for the Enhanced Task Manager.
 """
 
+import html
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QCheckBox, QGroupBox, QSpinBox, QComboBox, QTextEdit,
@@ -10,10 +13,43 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from core.safety_tiers import SafetyTier, SafetyInfo, get_tier_color
+from core.safety_tiers import SafetyTier, SafetyInfo
+
+
+@lru_cache(maxsize=None)
+def _header_font(size: int) -> QFont:
+    """Bold Segoe UI header font, built once per size (after QApplication exists)."""
+    return QFont("Segoe UI", size, QFont.Weight.Bold)
+
 
+def _rich_label(object_name: str, warning: str, detail: str) -> QLabel:
+    """Word-wrapped rich-text label: the escaped warning (if any) above a detail paragraph."""
+    text = f"<p>{html.escape(warning)}</p><p>{detail}</p>" if warning else detail
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.RichText)
+    label.setWordWrap(True)
+    label.setObjectName(object_name)
+    return label
 
-class KillConfirmDialog(QDialog):
+
+class _LazyDialog(QDialog):
+    """Dialog whose widget tree (the subclass's _build_ui) is built right before it is first shown."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._built = False
+
+    def setVisible(self, visible: bool):
+        # Build before Qt sizes and shows the dialog, with relayout suppressed meanwhile
+        if visible and not self._built:
+            self._built = True
+            self.setUpdatesEnabled(False)
+            self._build_ui()
+            self.setUpdatesEnabled(True)
+        super().setVisible(visible)
+
+
+class KillConfirmDialog(_LazyDialog):
     """Confirmation dialog for terminating processes."""
 
     def __init__(self, proc_name: str, pid: int, safety: SafetyInfo, parent=None):
@@ -21,49 +57,45 @@ class KillConfirmDialog(QDialog):
         self.setWindowTitle("Confirm Process Termination")
         self.setMinimumWidth(450)
         self.confirmed = False
-        self._build_ui(proc_name, pid, safety)
+        self._proc_name = proc_name
+        self._pid = pid
+        self._safety = safety
 
-    def _build_ui(self, proc_name: str, pid: int, safety: SafetyInfo):
+    def _build_ui(self):
+        proc_name, pid, safety = self._proc_name, self._pid, self._safety
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
 
         # Header
-        tier_color = get_tier_color(safety.tier)
         header = QLabel(f"Terminate: {proc_name} (PID {pid})")
-        header.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        header.setFont(_header_font(14))
         layout.addWidget(header)
 
         # Safety tier indicator
         tier_label = QLabel(f"Safety Level: {safety.label}")
-        tier_label.setStyleSheet(f"color: {tier_color}; font-weight: bold; font-size: 14px;")
+        tier_label.setObjectName("tierLabel")
+        tier_label.setProperty("tier", safety.tier.value)
         layout.addWidget(tier_label)
 
         if safety.tier == SafetyTier.RED:
             # Red tier: hard block with override
             warning_box = QGroupBox("System Critical Process")
-            warning_box.setStyleSheet(f"QGroupBox {{ border-color: {tier_color}; }}")
+            warning_box.setProperty("tier", safety.tier.value)
+            # One rich-text label rather than a label per paragraph
+            warning_text = _rich_label(
+                "warnRed", safety.warning,
+                "<b>Terminating this process WILL cause system instability, "
+                "data loss, or a system crash (BSOD). This action is blocked by default.</b>"
+            )
             wl = QVBoxLayout(warning_box)
-
-            warning_text = QLabel(safety.warning)
-            warning_text.setWordWrap(True)
-            warning_text.setStyleSheet("color: #f38ba8; font-size: 13px;")
             wl.addWidget(warning_text)
-
-            warning2 = QLabel(
-                "Terminating this process WILL cause system instability, "
-                "data loss, or a system crash (BSOD). This action is blocked by default."
-            )
-            warning2.setWordWrap(True)
-            warning2.setStyleSheet("color: #fab387;")
-            wl.addWidget(warning2)
-
             layout.addWidget(warning_box)
 
             # Override checkbox
             self.override_check = QCheckBox(
                 "I understand the risks and want to force-terminate this process"
             )
-            self.override_check.setStyleSheet("color: #f38ba8;")
+            self.override_check.setObjectName("overrideCheck")
             layout.addWidget(self.override_check)
 
             # Buttons
@@ -85,21 +117,14 @@ class KillConfirmDialog(QDialog):
         elif safety.tier == SafetyTier.YELLOW:
             # Yellow tier: caution with explanation
             warning_box = QGroupBox("Caution")
-            warning_box.setStyleSheet(f"QGroupBox {{ border-color: {tier_color}; }}")
-            wl = QVBoxLayout(warning_box)
-
-            if safety.warning:
-                warning_text = QLabel(safety.warning)
-                warning_text.setWordWrap(True)
-                warning_text.setStyleSheet("color: #fab387;")
-                wl.addWidget(warning_text)
-
-            consequence = QLabel(
+            warning_box.setProperty("tier", safety.tier.value)
+            warning_text = _rich_label(
+                "warnOrange", safety.warning,
                 "Terminating this process may affect system functionality. "
                 "The process may restart automatically."
             )
-            consequence.setWordWrap(True)
-            wl.addWidget(consequence)
+            wl = QVBoxLayout(warning_box)
+            wl.addWidget(warning_text)
             layout.addWidget(warning_box)
 
             # Buttons
@@ -136,7 +161,7 @@ class KillConfirmDialog(QDialog):
         self.accept()
 
 
-class PriorityDialog(QDialog):
+class PriorityDialog(_LazyDialog):
     """Dialog for setting process priority."""
 
     PRIORITIES = [
@@ -153,9 +178,9 @@ class PriorityDialog(QDialog):
         self.setWindowTitle(f"Set Priority — {proc_name}")
         self.setMinimumWidth(350)
         self.selected_priority = None
-        self._build_ui(current_nice)
+        self._current_nice = current_nice
 
-    def _build_ui(self, current_nice: int):
+    def _build_ui(self):
         layout = QVBoxLayout(self)
 
         label = QLabel("Select priority level:")
@@ -165,14 +190,13 @@ class PriorityDialog(QDialog):
         for name, value in self.PRIORITIES:
             self.combo.addItem(name, value)
 
-        # Map psutil nice values to our combo indices
-        nice_map = {256: 0, 128: 1, 32768: 2, 32: 3, 16384: 4, 64: 5}
-        idx = nice_map.get(current_nice, 3)
-        self.combo.setCurrentIndex(idx)
+        # Select the current psutil nice value, defaulting to Normal
+        idx = self.combo.findData(self._current_nice)
+        self.combo.setCurrentIndex(3 if idx < 0 else idx)
         layout.addWidget(self.combo)
 
         warning = QLabel("Setting priority to Realtime may make the system unresponsive.")
-        warning.setStyleSheet("color: #fab387; font-size: 11px;")
+        warning.setObjectName("warnSmall")
         warning.setWordWrap(True)
         layout.addWidget(warning)
 
@@ -192,7 +216,7 @@ class PriorityDialog(QDialog):
         self.accept()
 
 
-class AffinityDialog(QDialog):
+class AffinityDialog(_LazyDialog):
     """Dialog for setting CPU affinity."""
 
     def __init__(self, proc_name: str, cpu_count: int,
@@ -201,9 +225,11 @@ class AffinityDialog(QDialog):
         self.setWindowTitle(f"Set Affinity — {proc_name}")
         self.setMinimumWidth(300)
         self.selected_cpus = []
-        self._build_ui(cpu_count, current_affinity)
+        self.cpu_checks = []
+        self._cpu_count = cpu_count
+        self._current_affinity = current_affinity
 
-    def _build_ui(self, cpu_count: int, current_affinity: list[int]):
+    def _build_ui(self):
         layout = QVBoxLayout(self)
 
         label = QLabel("Select which CPUs this process can use:")
@@ -221,11 +247,11 @@ class AffinityDialog(QDialog):
 
         # CPU checkboxes in a grid
         grid = QGridLayout()
-        self.cpu_checks = []
+        current = set(self._current_affinity)
         cols = 4
-        for i in range(cpu_count):
+        for i in range(self._cpu_count):
             cb = QCheckBox(f"CPU {i}")
-            cb.setChecked(i in current_affinity)
+            cb.setChecked(i in current)
             self.cpu_checks.append(cb)
             grid.addWidget(cb, i // cols, i % cols)
         layout.addLayout(grid)
@@ -243,12 +269,19 @@ class AffinityDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def _select_all(self):
-        for cb in self.cpu_checks:
-            cb.setChecked(True)
+        self._set_all_checked(True)
 
     def _deselect_all(self):
+        self._set_all_checked(False)
+
+    def _set_all_checked(self, checked: bool):
+        """Check/uncheck every CPU box with one repaint and no per-box signals."""
+        self.setUpdatesEnabled(False)
         for cb in self.cpu_checks:
-            cb.setChecked(False)
+            cb.blockSignals(True)
+            cb.setChecked(checked)
+            cb.blockSignals(False)
+        self.setUpdatesEnabled(True)
 
     def _on_ok(self):
         self.selected_cpus = [i for i, cb in enumerate(self.cpu_checks) if cb.isChecked()]
@@ -257,7 +290,7 @@ class AffinityDialog(QDialog):
         self.accept()
 
 
-class SuppressionDialog(QDialog):
+class SuppressionDialog(_LazyDialog):
     """Dialog for choosing how to suppress a process."""
 
     def __init__(self, proc_name: str, exe_path: str = "",
@@ -267,37 +300,38 @@ class SuppressionDialog(QDialog):
         self.setMinimumWidth(450)
         self.proc_name = proc_name
         self.selected_methods = []
-        self._build_ui(exe_path, services or [])
+        self.checks = []  # (method key, checkbox)
+        self._exe_path = exe_path
+        self._services = services or []
 
-    def _build_ui(self, exe_path: str, services: list):
+    def _build_ui(self):
+        exe_path, services = self._exe_path, self._services
         layout = QVBoxLayout(self)
 
         header = QLabel(f"Prevent '{self.proc_name}' from respawning")
-        header.setFont(QFont("Segoe UI", 13, QFont.Weight.Bold))
+        header.setFont(_header_font(13))
         layout.addWidget(header)
 
         desc = QLabel("Select suppression methods:")
         layout.addWidget(desc)
 
-        self.checks = {}
-
         if services:
             for svc in services:
                 cb = QCheckBox(f"Disable Windows Service: {svc}")
-                self.checks[f"service:{svc}"] = cb
+                self.checks.append((f"service:{svc}", cb))
                 layout.addWidget(cb)
 
         cb_startup = QCheckBox("Disable startup entry (if exists)")
-        self.checks["startup"] = cb_startup
+        self.checks.append(("startup", cb_startup))
         layout.addWidget(cb_startup)
 
         cb_task = QCheckBox("Disable scheduled task (if exists)")
-        self.checks["task"] = cb_task
+        self.checks.append(("task", cb_task))
         layout.addWidget(cb_task)
 
         if exe_path:
             cb_ifeo = QCheckBox(f"Block via IFEO (prevents {self.proc_name} from launching)")
-            self.checks["ifeo"] = cb_ifeo
+            self.checks.append(("ifeo", cb_ifeo))
             layout.addWidget(cb_ifeo)
 
             warning = QLabel(
@@ -305,7 +339,7 @@ class SuppressionDialog(QDialog):
                 "Use with caution."
             )
             warning.setWordWrap(True)
-            warning.setStyleSheet("color: #fab387; font-size: 11px;")
+            warning.setObjectName("warnSmall")
             layout.addWidget(warning)
 
         # Buttons
@@ -321,12 +355,12 @@ class SuppressionDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def _on_apply(self):
-        self.selected_methods = [k for k, cb in self.checks.items() if cb.isChecked()]
+        self.selected_methods = [k for k, cb in self.checks if cb.isChecked()]
         if self.selected_methods:
             self.accept()
 
 
-class RespawnAlertDialog(QDialog):
+class RespawnAlertDialog(_LazyDialog):
     """Alert when a killed process respawns."""
 
     def __init__(self, proc_name: str, new_pid: int, parent=None):
@@ -334,14 +368,16 @@ class RespawnAlertDialog(QDialog):
         self.setWindowTitle("Process Respawned")
         self.setMinimumWidth(400)
         self.action = None  # "suppress", "kill", None
-        self._build_ui(proc_name, new_pid)
+        self._proc_name = proc_name
+        self._new_pid = new_pid
 
-    def _build_ui(self, proc_name: str, new_pid: int):
+    def _build_ui(self):
+        proc_name, new_pid = self._proc_name, self._new_pid
         layout = QVBoxLayout(self)
 
         header = QLabel(f"'{proc_name}' has respawned!")
-        header.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        header.setStyleSheet("color: #fab387;")
+        header.setFont(_header_font(14))
+        header.setObjectName("respawnHeader")
         layout.addWidget(header)
 
         info = QLabel(f"The process was detected running again with PID {new_pid}.")
@@ -2,30 +2,28 @@
 Main application window — ties all components together.
 """
 
-import psutil
+import time
+
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QStatusBar, QVBoxLayout, QWidget,
     QMenuBar, QToolBar, QLabel, QSpinBox, QHBoxLayout, QMessageBox
 )
 from PyQt6.QtCore import QTimer, Qt, QSettings
-from PyQt6.QtGui import QAction, QKeySequence, QShortcut, QIcon
+from PyQt6.QtGui import QAction, QActionGroup, QKeySequence, QShortcut, QIcon
 
 from core.process_manager import ProcessManager, PerformanceCollector
 from core.suppression_manager import SuppressionManager
-from core.startup_manager import StartupManager
-from core.network_monitor import NetworkMonitor
-from core.security_checker import SecurityChecker
 
 from ui.process_table import ProcessTableWidget
 from ui.performance_tab import PerformanceTab
-from ui.startup_tab import StartupTab
-from ui.network_tab import NetworkTab
-from ui.suppression_tab import SuppressionTab
-from ui.security_tab import SecurityTab
 from ui.system_tray import SystemTrayIcon
 from ui.styles import DARK_THEME, LIGHT_THEME
 
 
+# Minimum spacing between refreshes so F5 and the timer cannot run back-to-back
+_MIN_REFRESH_GAP = 0.25
+
+
 class MainWindow(QMainWindow):
     """Enhanced Task Manager main window."""
 
@@ -40,21 +38,22 @@ class MainWindow(QMainWindow):
         self._dark_mode = self.settings.value("dark_mode", True, type=bool)
         self._refresh_interval = self.settings.value("refresh_interval", 2000, type=int)
         self._service_refresh_counter = 0
+        self._last_refresh = 0.0
 
-        # Core managers
+        # Core managers (tab-specific ones are created along with their tab)
         self.process_manager = ProcessManager()
-        self.perf_collector = PerformanceCollector()
+        self.perf_collector = PerformanceCollector(self.process_manager)
         self.suppression_manager = SuppressionManager()
-        self.startup_manager = StartupManager()
-        self.network_monitor = NetworkMonitor()
-        self.security_checker = SecurityChecker()
+        self.startup_manager = None
+        self.network_monitor = None
+        self.security_checker = None
 
         # Initial service map load
         self.process_manager.refresh_services_map()
 
         # Build UI
-        self._build_menu()
         self._build_tabs()
+        self._build_menu()
         self._build_statusbar()
         self._setup_shortcuts()
         self._setup_tray()
@@ -69,7 +68,6 @@ class MainWindow(QMainWindow):
 
         # Initial data load
         self._on_refresh_tick()
-        self.startup_tab.refresh()
 
     def _build_menu(self):
         menubar = self.menuBar()
@@ -79,7 +77,7 @@ class MainWindow(QMainWindow):
 
         export_action = QAction("Export Process List...", self)
         export_action.setShortcut(QKeySequence("Ctrl+E"))
-        export_action.triggered.connect(lambda: self.process_tab._export_csv())
+        export_action.triggered.connect(self.process_tab._export_csv)
         file_menu.addAction(export_action)
 
         file_menu.addSeparator()
@@ -101,10 +99,16 @@ class MainWindow(QMainWindow):
 
         # Refresh interval submenu
         interval_menu = view_menu.addMenu("Refresh Interval")
+        self._interval_group = QActionGroup(self)
+        self._interval_group.setExclusive(True)
+        self._interval_group.triggered.connect(self._on_interval_action)
         for label, ms in [("0.5s", 500), ("1s", 1000), ("2s (Default)", 2000),
                           ("5s", 5000), ("10s", 10000)]:
             action = QAction(label, self)
-            action.triggered.connect(lambda checked, v=ms: self._set_refresh_interval(v))
+            action.setData(ms)
+            action.setCheckable(True)
+            action.setChecked(ms == self._refresh_interval)
+            self._interval_group.addAction(action)
             interval_menu.addAction(action)
 
         # Actions menu
@@ -119,7 +123,7 @@ class MainWindow(QMainWindow):
 
         end_task_action = QAction("End Selected Task", self)
         end_task_action.setShortcut(QKeySequence("Delete"))
-        end_task_action.triggered.connect(lambda: self.process_tab._on_end_task())
+        end_task_action.triggered.connect(self.process_tab._on_end_task)
         actions_menu.addAction(end_task_action)
 
         # Help menu
@@ -137,35 +141,82 @@ class MainWindow(QMainWindow):
         self.process_tab = ProcessTableWidget(
             self.process_manager, self.suppression_manager
         )
-        self.process_tab.status_message.connect(self._show_status)
+        self.process_tab.status_message.connect(
+            self._show_status, Qt.ConnectionType.QueuedConnection)
+        self.process_tab.process_count_changed.connect(self._on_process_count)
         self.tabs.addTab(self.process_tab, "Processes")
 
-        # Performance tab
+        # The other tabs start as placeholders and are built the first time they are shown
+        self.perf_tab = None
+        self.startup_tab = None
+        self.network_tab = None
+        self.security_tab = None
+        self.suppression_tab = None
+        self._tab_builders = {}
+        for title, builder in [("Performance", self._make_perf_tab),
+                               ("Startup", self._make_startup_tab),
+                               ("Network", self._make_network_tab),
+                               ("Security", self._make_security_tab),
+                               ("Suppression", self._make_suppression_tab)]:
+            self._tab_builders[self.tabs.addTab(QWidget(), title)] = builder
+
+        # Refresh tab-specific data on tab change
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _make_perf_tab(self) -> QWidget:
         self.perf_tab = PerformanceTab(self.perf_collector)
-        self.tabs.addTab(self.perf_tab, "Performance")
+        return self.perf_tab
 
-        # Startup tab
+    # Tabs other than Processes import their modules on first visit
+    def _make_startup_tab(self) -> QWidget:
+        from core.startup_manager import StartupManager
+        from ui.startup_tab import StartupTab
+        self.startup_manager = StartupManager()
         self.startup_tab = StartupTab(self.startup_manager)
-        self.startup_tab.status_message.connect(self._show_status)
-        self.tabs.addTab(self.startup_tab, "Startup")
+        self.startup_tab.status_message.connect(
+            self._show_status, Qt.ConnectionType.QueuedConnection)
+        return self.startup_tab
 
-        # Network tab
+    def _make_network_tab(self) -> QWidget:
+        from core.network_monitor import NetworkMonitor
+        from ui.network_tab import NetworkTab
+        self.network_monitor = NetworkMonitor()
         self.network_tab = NetworkTab(self.network_monitor)
-        self.network_tab.status_message.connect(self._show_status)
-        self.tabs.addTab(self.network_tab, "Network")
+        self.network_tab.status_message.connect(
+            self._show_status, Qt.ConnectionType.QueuedConnection)
+        return self.network_tab
 
-        # Security tab
+    def _make_security_tab(self) -> QWidget:
+        from core.security_checker import SecurityChecker
+        from ui.security_tab import SecurityTab
+        self.security_checker = SecurityChecker()
         self.security_tab = SecurityTab(self.security_checker)
-        self.security_tab.status_message.connect(self._show_status)
-        self.tabs.addTab(self.security_tab, "Security")
+        self.security_tab.status_message.connect(
+            self._show_status, Qt.ConnectionType.QueuedConnection)
+        return self.security_tab
 
-        # Suppression tab
+    def _make_suppression_tab(self) -> QWidget:
+        from ui.suppression_tab import SuppressionTab
         self.suppression_tab = SuppressionTab(self.suppression_manager)
-        self.suppression_tab.status_message.connect(self._show_status)
-        self.tabs.addTab(self.suppression_tab, "Suppression")
-
-        # Refresh tab-specific data on tab change
-        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.suppression_tab.status_message.connect(
+            self._show_status, Qt.ConnectionType.QueuedConnection)
+        return self.suppression_tab
+
+    def _ensure_tab(self, index: int):
+        """Swap a placeholder tab for its real widget on first view."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        widget = builder()
+        placeholder = self.tabs.widget(index)
+        title = self.tabs.tabText(index)
+        # Removing/inserting would otherwise re-enter _on_tab_changed
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
 
     def _build_statusbar(self):
         self.status_bar = QStatusBar()
@@ -174,17 +225,18 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Ready")
         self.status_bar.addWidget(self.status_label, 1)
 
-        self.cpu_status = QLabel("CPU: —%")
-        self.cpu_status.setMinimumWidth(100)
-        self.status_bar.addPermanentWidget(self.cpu_status)
+        # One reusable single-shot timer resets the status text; restarting it extends the wait
+        self._status_clear_timer = QTimer(self)
+        self._status_clear_timer.setSingleShot(True)
+        self._status_clear_timer.setInterval(5000)
+        self._status_clear_timer.timeout.connect(self._clear_status)
 
-        self.mem_status = QLabel("RAM: —%")
-        self.mem_status.setMinimumWidth(100)
-        self.status_bar.addPermanentWidget(self.mem_status)
-
-        self.proc_count_status = QLabel("Processes: —")
-        self.proc_count_status.setMinimumWidth(100)
-        self.status_bar.addPermanentWidget(self.proc_count_status)
+        # CPU, RAM and process count share one label: one text layout per update
+        self._process_count = "—"
+        self.metrics_status = QLabel("CPU: —%   RAM: —%   Processes: —")
+        self.metrics_status.setTextFormat(Qt.TextFormat.PlainText)
+        self.metrics_status.setMinimumWidth(320)
+        self.status_bar.addPermanentWidget(self.metrics_status)
 
     def _setup_shortcuts(self):
         # Ctrl+F = search
@@ -210,27 +262,31 @@ class MainWindow(QMainWindow):
         mode = "Dark" if self._dark_mode else "Light"
         self._show_status(f"Switched to {mode} mode")
 
+    def _on_interval_action(self, action: QAction):
+        self._set_refresh_interval(action.data())
+
     def _set_refresh_interval(self, ms: int):
         self._refresh_interval = ms
         self.settings.setValue("refresh_interval", ms)
-        self._refresh_timer.setInterval(ms)
+        # start() rather than setInterval() so the new cadence applies immediately
+        self._refresh_timer.start(ms)
         self._show_status(f"Refresh interval set to {ms}ms")
 
     def _on_refresh_tick(self):
         """Called every refresh interval."""
-        # Collect performance data
-        self.perf_collector.collect()
-
-        # Update status bar
-        metrics = self.perf_collector.get_current()
-        cpu = metrics['cpu_percent']
-        mem = metrics['memory_percent']
+        now = time.monotonic()
+        if now - self._last_refresh < _MIN_REFRESH_GAP:
+            return
+        self._last_refresh = now
 
-        self.cpu_status.setText(f"CPU: {cpu:.0f}%")
-        self.mem_status.setText(f"RAM: {mem:.0f}%")
+        # Collect performance data
+        collector = self.perf_collector
+        collector.collect()
 
         # Tray icon
-        self.tray_icon.update_stats(cpu, mem, metrics['disk_percent'])
+        self.tray_icon.update_stats(
+            collector.cpu_percent, collector.memory_percent, collector.disk_percent
+        )
 
         # Refresh service map periodically (every 30 ticks ~ 1 minute at 2s)
         self._service_refresh_counter += 1
@@ -238,19 +294,49 @@ class MainWindow(QMainWindow):
             self._service_refresh_counter = 0
             self.process_manager.refresh_services_map()
 
+        # Hidden to tray: keep sampling history, skip status bar and tab work
+        if self.isVisible():
+            self._refresh_view()
+
+    def _refresh_view(self):
+        """Update the status bar and the active tab."""
+        self._update_metrics_status()
+
         # Refresh active tab
         current_tab = self.tabs.currentIndex()
         if current_tab == 0:  # Processes
             self.process_tab.refresh()
-            processes = self.process_manager.get_processes()
-            self.proc_count_status.setText(f"Processes: {len(processes)}")
         elif current_tab == 1:  # Performance
             self.perf_tab.update_data()
         elif current_tab == 3:  # Network
             self.network_tab.refresh()
 
+    def _on_process_count(self, count: int):
+        self._process_count = count
+        self._update_metrics_status()
+
+    def _update_metrics_status(self):
+        collector = self.perf_collector
+        self._set_label_text(
+            self.metrics_status,
+            f"CPU: {collector.cpu_percent:.0f}%   RAM: {collector.memory_percent:.0f}%   "
+            f"Processes: {self._process_count}"
+        )
+
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str):
+        """Set label text only when it changed, avoiding needless relayout."""
+        if label.text() != text:
+            label.setText(text)
+
+    def showEvent(self, event):
+        """Bring the view up to date when shown (e.g. restored from the tray)."""
+        super().showEvent(event)
+        self._refresh_view()
+
     def _on_tab_changed(self, index: int):
         """Handle tab switch — load data for newly active tab."""
+        self._ensure_tab(index)
         if index == 0:
             self.process_tab.refresh()
         elif index == 1:
@@ -275,7 +361,10 @@ class MainWindow(QMainWindow):
     def _show_status(self, msg: str):
         self.status_label.setText(msg)
         # Auto-clear after 5 seconds
-        QTimer.singleShot(5000, lambda: self.status_label.setText("Ready"))
+        self._status_clear_timer.start()
+
+    def _clear_status(self):
+        self.status_label.setText("Ready")
 
     def _show_about(self):
         QMessageBox.about(
@@ -309,5 +398,8 @@ class MainWindow(QMainWindow):
     def force_quit(self):
         """Actually quit the application."""
         self.tray_icon.hide()
+        if self.network_monitor is not None:
+            self.network_monitor.stop()
+        self.suppression_manager.close()
         from PyQt6.QtWidgets import QApplication
         QApplication.quit()
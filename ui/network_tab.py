@@ -2,18 +2,73 @@
 Network Activity Monitor tab — per-process connections, reverse DNS, suspicious detection.
 """
 
+from typing import Optional
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QPushButton, QLabel, QAbstractItemView, QComboBox, QLineEdit
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QThread, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt6.QtGui import QColor, QBrush, QFont
 
 from core.network_monitor import NetworkMonitor, ConnectionInfo
 
 
+# Column headers, initial widths, and the ConnectionInfo field each column sorts by
+_COLUMNS = (
+    "Process", "PID", "Protocol", "Local Address", "Local Port",
+    "Remote Address", "Remote Port", "Hostname", "State", "⚠"
+)
+_COLUMN_WIDTHS = (130, 60, 65, 130, 70, 130, 70, 180, 100, 30)
+_SORT_FIELDS = (
+    "process_name", "pid", "protocol", "local_addr", "local_port",
+    "remote_addr", "remote_port", "remote_hostname", "state", "is_suspicious"
+)
+
+# Raw (numeric where applicable) cell values, so PIDs and ports sort numerically
+_SORT_ROLE = Qt.ItemDataRole.UserRole
+
+_SUSPICIOUS_COLOR = "#f38ba8"
+
+# Idle time after the last keystroke before the search is applied
+_SEARCH_DEBOUNCE_MS = 100
+
+
+def _display_row(conn: ConnectionInfo) -> tuple[str, ...]:
+    """Display strings for one connection, in column order."""
+    return (
+        conn.process_name, str(conn.pid), conn.protocol,
+        conn.local_addr, str(conn.local_port),
+        conn.remote_addr, str(conn.remote_port),
+        conn.remote_hostname, conn.state,
+        "⚠" if conn.is_suspicious else "",
+    )
+
+
+def _search_blob(conn: ConnectionInfo) -> str:
+    """Case-folded text the search box matches against."""
+    return f"{conn.process_name} {conn.pid} {conn.remote_addr} {conn.remote_hostname} {conn.local_addr}".casefold()
+
+
+def _filter_rows(connections: list[ConnectionInfo]) -> dict[str, list[int]]:
+    """Row indices for each filter-combo key except "all", found in one pass."""
+    established, listening, suspicious = [], [], []
+    for i, c in enumerate(connections):
+        state = c.state
+        if state == "ESTABLISHED":
+            established.append(i)
+        elif state == "LISTEN":
+            listening.append(i)
+        if c.is_suspicious:
+            suspicious.append(i)
+    return {"established": established, "listen": listening, "suspicious": suspicious}
+
+
 class NetworkRefreshWorker(QThread):
-    finished = pyqtSignal(list)
+    # connections, display rows, search blobs, per-filter rows — all built off the UI thread
+    finished = pyqtSignal(list, list, list, dict)
 
     def __init__(self, monitor: NetworkMonitor):
         super().__init__()
@@ -21,7 +76,147 @@ class NetworkRefreshWorker(QThread):
 
     def run(self):
         connections = self.monitor.get_connections()
-        self.finished.emit(connections)
+        rows = [_display_row(c) for c in connections]
+        blobs = [_search_blob(c) for c in connections]
+        self.finished.emit(connections, rows, blobs, _filter_rows(connections))
+
+
+class ConnectionTableModel(QAbstractTableModel):
+    """Table model over a list of connections; the view pulls only the cells it paints."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._connections: list[ConnectionInfo] = []
+        self._rows: list[tuple[str, ...]] = []
+        self.search_blobs: list[str] = []
+        self.filter_rows: dict[str, list[int]] = {}
+        self._row_count = 0
+        self.generation = 0  # bumped whenever the connection list changes
+        self._suspicious_brush = QBrush(QColor(_SUSPICIOUS_COLOR))
+
+    def set_connections(self, connections: list[ConnectionInfo],
+                        rows: list[tuple[str, ...]], blobs: list[str],
+                        filter_rows: dict[str, list[int]]):
+        """Swap in a new snapshot, signalling only the rows that differ from the last one."""
+        old = self._connections
+        old_count, new_count = len(old), len(connections)
+        changed = [
+            i for i in range(min(old_count, new_count))
+            if old[i] is not connections[i] and old[i] != connections[i]
+        ]
+        if not changed and old_count == new_count:
+            return
+
+        self.generation += 1
+        self.filter_rows = filter_rows
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._connections, self._rows, self.search_blobs = connections, rows, blobs
+            self._row_count = new_count
+            self.endRemoveRows()
+        else:
+            self._connections, self._rows, self.search_blobs = connections, rows, blobs
+
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0), self.index(changed[-1], len(_COLUMNS) - 1)
+            )
+
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._row_count = new_count
+            self.endInsertRows()
+
+    @property
+    def connections(self) -> list[ConnectionInfo]:
+        return self._connections
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][col]
+        conn = self._connections[row]
+        if role == _SORT_ROLE:
+            return getattr(conn, _SORT_FIELDS[col])
+        if conn.is_suspicious:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._suspicious_brush
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return conn.suspicion_reason
+        return None
+
+
+class ConnectionFilterProxy(QSortFilterProxyModel):
+    """Sorts connections and applies the state filter and search text."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter = "all"
+        self._search = ""
+        # (filter, search) -> accepted source rows, valid for one source generation
+        self._generation = -1
+        self._filter_cache: dict[tuple[str, str], frozenset[int]] = {}
+        self._accepted: Optional[frozenset[int]] = None
+        # Last computed (filter, search) and its rows, for narrowing as the user types
+        self._last: Optional[tuple[tuple[str, str], frozenset[int]]] = None
+        self.setSortRole(_SORT_ROLE)
+
+    def set_filter(self, filter_key: str, search: str):
+        if filter_key == self._filter and search == self._search:
+            return
+        self._filter = filter_key
+        self._search = search
+        self._accepted = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        generation = self.sourceModel().generation
+        if generation != self._generation:
+            # Checked here rather than via a model signal, which could arrive after
+            # the proxy has already started re-filtering the changed rows
+            self._generation = generation
+            self._filter_cache.clear()
+            self._accepted = None
+            self._last = None
+        if self._accepted is None:
+            key = (self._filter, self._search)
+            accepted = self._filter_cache.get(key)
+            if accepted is None:
+                accepted = self._filter_cache[key] = frozenset(self._matching_rows())
+            self._accepted = accepted
+            self._last = (key, accepted)
+        return source_row in self._accepted
+
+    def _matching_rows(self):
+        """Source rows passing the current filter and search, in one scan."""
+        model = self.sourceModel()
+        last = self._last
+        if last is not None and last[0][0] == self._filter and self._search.startswith(last[0][1]):
+            # Extending the search text can only drop rows: rescan the previous survivors
+            rows = last[1]
+        else:
+            rows = model.filter_rows.get(self._filter)
+            if rows is None:
+                rows = range(len(model.connections))
+        if self._search:
+            blobs = model.search_blobs
+            search = self._search
+            rows = [i for i in rows if search in blobs[i]]
+        return rows
 
 
 class NetworkTab(QWidget):
@@ -33,6 +228,7 @@ class NetworkTab(QWidget):
         super().__init__(parent)
         self.nm = network_monitor
         self._connections: list[ConnectionInfo] = []
+        self._counts = (0, 0, 0)  # established, listening, suspicious
         self._worker = None
         self._filter = "all"
         self._search = ""
@@ -64,6 +260,12 @@ class NetworkTab(QWidget):
         self.search_box.textChanged.connect(self._on_search)
         header_layout.addWidget(self.search_box)
 
+        # Restarted on every keystroke so a burst of typing filters once
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._update_table)
+
         refresh_btn = QPushButton("Refresh")
         refresh_btn.setObjectName("primaryBtn")
         refresh_btn.clicked.connect(self.refresh)
@@ -77,20 +279,17 @@ class NetworkTab(QWidget):
         layout.addWidget(self.stats_label)
 
         # Table
-        columns = [
-            "Process", "PID", "Protocol", "Local Address", "Local Port",
-            "Remote Address", "Remote Port", "Hostname", "State", "⚠"
-        ]
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
+        self.model = ConnectionTableModel(self)
+        self.proxy = ConnectionFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
 
-        widths = [130, 60, 65, 130, 70, 130, 70, 180, 100, 30]
-        for i, w in enumerate(widths):
+        for i, w in enumerate(_COLUMN_WIDTHS):
             self.table.setColumnWidth(i, w)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSortingEnabled(True)
@@ -100,77 +299,39 @@ class NetworkTab(QWidget):
     def refresh(self):
         if self._worker and self._worker.isRunning():
             return
+        if not self._connections:
+            self.stats_label.setText("Loading connections...")
         self._worker = NetworkRefreshWorker(self.nm)
         self._worker.finished.connect(self._on_data_ready)
         self._worker.start()
 
-    def _on_data_ready(self, connections: list):
+    def _on_data_ready(self, connections: list, rows: list, blobs: list, filter_rows: dict):
         self._connections = connections
+        self.model.set_connections(connections, rows, blobs, filter_rows)
+        self._counts = (
+            len(filter_rows["established"]), len(filter_rows["listen"]),
+            len(filter_rows["suspicious"]),
+        )
         self._update_table()
 
     def _on_filter(self):
         self._filter = self.filter_combo.currentData()
+        self._search_timer.stop()
         self._update_table()
 
     def _on_search(self, text: str):
-        self._search = text.lower()
-        self._update_table()
+        self._search = text.casefold()
+        self._search_timer.start()
 
     def _update_table(self):
-        filtered = self._connections
-
-        # Apply filter
-        if self._filter == "established":
-            filtered = [c for c in filtered if c.state == "ESTABLISHED"]
-        elif self._filter == "listen":
-            filtered = [c for c in filtered if c.state == "LISTEN"]
-        elif self._filter == "suspicious":
-            filtered = [c for c in filtered if c.is_suspicious]
-
-        # Apply search
-        if self._search:
-            filtered = [
-                c for c in filtered
-                if self._search in f"{c.process_name} {c.pid} {c.remote_addr} {c.remote_hostname} {c.local_addr}".lower()
-            ]
-
-        self.table.setUpdatesEnabled(False)
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(filtered))
-
-        for row, conn in enumerate(filtered):
-            items = [
-                QTableWidgetItem(conn.process_name),
-                QTableWidgetItem(str(conn.pid)),
-                QTableWidgetItem(conn.protocol),
-                QTableWidgetItem(conn.local_addr),
-                QTableWidgetItem(str(conn.local_port)),
-                QTableWidgetItem(conn.remote_addr),
-                QTableWidgetItem(str(conn.remote_port)),
-                QTableWidgetItem(conn.remote_hostname),
-                QTableWidgetItem(conn.state),
-                QTableWidgetItem("⚠" if conn.is_suspicious else ""),
-            ]
-
-            if conn.is_suspicious:
-                for item in items:
-                    item.setForeground(QBrush(QColor("#f38ba8")))
-                    item.setToolTip(conn.suspicion_reason)
-
-            for col, item in enumerate(items):
-                self.table.setItem(row, col, item)
-
-        self.table.setUpdatesEnabled(True)
-        self.table.setSortingEnabled(True)
+        self.proxy.set_filter(self._filter, self._search)
 
         # Stats
         total = len(self._connections)
-        established = sum(1 for c in self._connections if c.state == "ESTABLISHED")
-        listening = sum(1 for c in self._connections if c.state == "LISTEN")
-        suspicious = sum(1 for c in self._connections if c.is_suspicious)
+        established, listening, suspicious = self._counts
 
         stats = f"{total} connections ({established} established, {listening} listening"
         if suspicious:
             stats += f", {suspicious} suspicious"
-        stats += f") — showing {len(filtered)}"
+        stats += f") — showing {self.proxy.rowCount()}"
         self.stats_label.setText(stats)
@@ -6,9 +6,11 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
     QFrame, QGroupBox, QSplitter, QComboBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QBrush, QPainterPath
+from PyQt6.QtCore import Qt, QThread, QTimer, QPointF, pyqtSignal
+from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QBrush, QPolygonF, QGuiApplication
 import time
+from collections import deque
+from typing import Optional
 import psutil
 
 from core.process_manager import PerformanceCollector
@@ -25,6 +27,18 @@ def format_bytes_speed(bps: float) -> str:
     return f"{bps:.0f} B/s"
 
 
+def _graph_points(data: deque[float], max_val: float, max_points: int,
+                  w: int, h: int) -> list[QPointF]:
+    """Right-aligned screen points for a series, y clamped to the widget."""
+    x_step = w / max(max_points - 1, 1)
+    start_x = w - (len(data) - 1) * x_step
+    scale = h / max(max_val, 0.001)
+    return [
+        QPointF(start_x + i * x_step, max(0.0, min(h, h - val * scale)))
+        for i, val in enumerate(data)
+    ]
+
+
 class MiniGraph(QWidget):
     """A small real-time line graph widget."""
 
@@ -34,16 +48,49 @@ class MiniGraph(QWidget):
         self.color = QColor(color)
         self.max_val = max_val
         self.label = label
-        self.data: list[float] = []
         self.max_points = 120  # ~4 minutes at 2s interval
+        self.data: deque[float] = deque(maxlen=self.max_points)
+        self._dirty = False  # repainted by PerformanceTab._flush_graphs
+        # Stroke and fill polygons kept across paints; _line is None until built for _line_size
+        self._line: Optional[QPolygonF] = None
+        self._fill: Optional[QPolygonF] = None
+        self._line_size = (0, 0)
         self.setMinimumHeight(100)
         self.setMinimumWidth(200)
 
     def add_point(self, value: float):
+        full = len(self.data) == self.max_points
         self.data.append(value)
-        if len(self.data) > self.max_points:
-            self.data = self.data[-self.max_points:]
-        self.update()
+        self._dirty = True
+        self._fill = None
+
+        # Scroll the cached line left one step and add the new point on the right
+        line = self._line
+        if line is not None:
+            w, h = self._line_size
+            if full:
+                line.remove(0)
+            line.translate(-w / max(self.max_points - 1, 1), 0)
+            y = h - value * h / max(self.max_val, 0.001)
+            line.append(QPointF(w, max(0.0, min(h, y))))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._line = None
+        self._fill = None
+
+    def _polygons(self, w: int, h: int) -> tuple[QPolygonF, QPolygonF]:
+        """Cached stroke polyline and fill polygon for the current size."""
+        if self._line is None or self._line_size != (w, h):
+            self._line = QPolygonF(_graph_points(self.data, self.max_val, self.max_points, w, h))
+            self._line_size = (w, h)
+            self._fill = None
+        if self._fill is None:
+            first_x = w - (len(self.data) - 1) * w / max(self.max_points - 1, 1)
+            self._fill = QPolygonF(self._line)
+            self._fill.append(QPointF(w, h))
+            self._fill.append(QPointF(first_x, h))
+        return self._line, self._fill
 
     def paintEvent(self, event):
         if not self.data:
@@ -68,47 +115,21 @@ class MiniGraph(QWidget):
         if len(self.data) < 2:
             return
 
-        pen = QPen(self.color, 2)
-        painter.setPen(pen)
+        line, fill = self._polygons(w, h)
 
         # Fill under line
         fill_color = QColor(self.color)
         fill_color.setAlpha(30)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(fill_color))
+        painter.drawPolygon(fill)
 
-        path = QPainterPath()
-        points_count = len(self.data)
-        x_step = w / max(self.max_points - 1, 1)
-
-        start_x = w - (points_count - 1) * x_step
-
-        first_y = h - (self.data[0] / max(self.max_val, 0.001)) * h
-        path.moveTo(start_x, h)
-        path.lineTo(start_x, first_y)
-
-        for i, val in enumerate(self.data):
-            x = start_x + i * x_step
-            y = h - (val / max(self.max_val, 0.001)) * h
-            y = max(0, min(h, y))
-            path.lineTo(x, y)
-
-        path.lineTo(start_x + (points_count - 1) * x_step, h)
-        path.closeSubpath()
-
-        painter.fillPath(path, QBrush(fill_color))
-
-        # Draw line on top
-        painter.setPen(pen)
-        for i in range(1, points_count):
-            x1 = start_x + (i - 1) * x_step
-            y1 = h - (self.data[i - 1] / max(self.max_val, 0.001)) * h
-            x2 = start_x + i * x_step
-            y2 = h - (self.data[i] / max(self.max_val, 0.001)) * h
-            y1 = max(0, min(h, y1))
-            y2 = max(0, min(h, y2))
-            painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+        # Draw line on top, as one polyline
+        painter.setPen(QPen(self.color, 2))
+        painter.drawPolyline(line)
 
         # Current value text
-        current = self.data[-1] if self.data else 0
+        current = self.data[-1]
         painter.setPen(QPen(QColor("#cdd6f4")))
         painter.setFont(QFont("Segoe UI", 9))
         painter.drawText(5, 15, f"{self.label}: {current:.1f}%")
@@ -126,24 +147,20 @@ class DualMiniGraph(QWidget):
         self.color2 = QColor(color2)
         self.label1 = label1
         self.label2 = label2
-        self.data1: list[float] = []
-        self.data2: list[float] = []
         self.max_val = 1.0
         self.max_points = 120
+        self.data1: deque[float] = deque(maxlen=self.max_points)
+        self.data2: deque[float] = deque(maxlen=self.max_points)
+        self._dirty = False  # repainted by PerformanceTab._flush_graphs
         self.setMinimumHeight(100)
         self.setMinimumWidth(200)
 
     def add_points(self, val1: float, val2: float):
         self.data1.append(val1)
         self.data2.append(val2)
-        if len(self.data1) > self.max_points:
-            self.data1 = self.data1[-self.max_points:]
-            self.data2 = self.data2[-self.max_points:]
         # Auto-scale
-        all_vals = self.data1 + self.data2
-        if all_vals:
-            self.max_val = max(max(all_vals) * 1.2, 1.0)
-        self.update()
+        self.max_val = max(max(self.data1) * 1.2, max(self.data2) * 1.2, 1.0)
+        self._dirty = True
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -160,20 +177,10 @@ class DualMiniGraph(QWidget):
         for data, color in [(self.data1, self.color1), (self.data2, self.color2)]:
             if len(data) < 2:
                 continue
-            pen = QPen(color, 2)
-            painter.setPen(pen)
-            points_count = len(data)
-            x_step = w / max(self.max_points - 1, 1)
-            start_x = w - (points_count - 1) * x_step
-
-            for i in range(1, points_count):
-                x1 = start_x + (i - 1) * x_step
-                y1 = h - (data[i - 1] / max(self.max_val, 0.001)) * h
-                x2 = start_x + i * x_step
-                y2 = h - (data[i] / max(self.max_val, 0.001)) * h
-                y1 = max(0, min(h, y1))
-                y2 = max(0, min(h, y2))
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+            painter.setPen(QPen(color, 2))
+            painter.drawPolyline(QPolygonF(
+                _graph_points(data, self.max_val, self.max_points, w, h)
+            ))
 
         # Labels
         painter.setFont(QFont("Segoe UI", 9))
@@ -215,14 +222,36 @@ class MetricCard(QFrame):
             self.detail_label.setText(detail)
 
 
+class TopProcessesWorker(QThread):
+    finished = pyqtSignal(list, list)
+
+    def __init__(self, collector: PerformanceCollector):
+        super().__init__()
+        self.collector = collector
+
+    def run(self):
+        top_cpu = self.collector.get_top_processes("cpu", 5)
+        top_mem = self.collector.get_top_processes("memory", 5)
+        self.finished.emit(top_cpu, top_mem)
+
+
 class PerformanceTab(QWidget):
     """Performance dashboard with real-time graphs and metrics."""
 
     def __init__(self, perf_collector: PerformanceCollector, parent=None):
         super().__init__(parent)
         self.collector = perf_collector
+        self._top_worker = None
         self._build_ui()
 
+        # Graph repaints are batched and issued at most once per screen frame
+        screen = QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen else 60.0
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(max(1, int(1000 / max(refresh_rate, 1.0))))
+        self._repaint_timer.timeout.connect(self._flush_graphs)
+
     def _build_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -359,20 +388,30 @@ class PerformanceTab(QWidget):
                     f"↓ {format_bytes_speed(nr)}"
                 )
 
-        # Update top processes
-        top_cpu = self.collector.get_top_processes("cpu", 5)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+        # Update top processes off the UI thread; a stale snapshot falls back to a process sweep
+        if not (self._top_worker and self._top_worker.isRunning()):
+            self._top_worker = TopProcessesWorker(self.collector)
+            self._top_worker.finished.connect(self._on_top_ready)
+            self._top_worker.start()
+
+    def _flush_graphs(self):
+        for graph in (self.cpu_graph, self.mem_graph, self.disk_graph, self.net_graph):
+            if graph._dirty:
+                graph._dirty = False
+                graph.update()
+
+    def _on_top_ready(self, top_cpu: list, top_mem: list):
         for i, proc in enumerate(top_cpu):
             if i < len(self.top_cpu_labels):
-                cpu_val = proc.get('cpu_percent', 0) or 0
                 self.top_cpu_labels[i].setText(
-                    f"{proc['name']}: {cpu_val:.1f}%"
+                    f"{proc.name}: {proc.cpu_percent:.1f}%"
                 )
 
-        top_mem = self.collector.get_top_processes("memory", 5)
         for i, proc in enumerate(top_mem):
             if i < len(self.top_mem_labels):
-                mem = proc.get('memory_info')
-                mb = mem.rss / (1024 * 1024) if mem else 0
                 self.top_mem_labels[i].setText(
-                    f"{proc['name']}: {mb:.0f} MB"
+                    f"{proc.name}: {proc.memory_mb:.0f} MB"
                 )
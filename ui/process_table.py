@@ -101,6 +101,7 @@ class ProcessTableWidget(QWidget):
 
     process_selected = pyqtSignal(int)  # PID
     status_message = pyqtSignal(str)
+    process_count_changed = pyqtSignal(int)
 
     def __init__(self, process_manager: ProcessManager,
                  suppression_manager: SuppressionManager, parent=None):
@@ -225,6 +226,7 @@ class ProcessTableWidget(QWidget):
         """Called when process data collection completes."""
         self._processes = processes
         self._update_table()
+        self.process_count_changed.emit(len(processes))
 
     def _on_filter_changed(self):
         self._filter_text = self.search_box.text().lower()
@@ -238,10 +240,8 @@ class ProcessTableWidget(QWidget):
     def _matches_filter(self, pi: ProcessInfo) -> bool:
         """Check if a process matches the current filters."""
         # Text filter
-        if self._filter_text:
-            searchable = f"{pi.pid} {pi.name} {pi.description} {pi.company} {pi.exe_path}".lower()
-            if self._filter_text not in searchable:
-                return False
+        if self._filter_text and self._filter_text not in pi.search_text:
+            return False
 
         # Category filter
         if self._filter_category != "all" and pi.category != self._filter_category:
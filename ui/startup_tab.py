@@ -168,10 +168,13 @@ class StartupTab(QWidget):
             self.table.setItem(row, 5, QTableWidgetItem(item.description))
 
         self.table.setUpdatesEnabled(True)
-        self.count_label.setText(
+        text = (
             f"{len(self._items)} startup items "
             f"({sum(1 for i in self._items if i.enabled)} enabled)"
         )
+        if not self.sm.is_admin:
+            text += " — run as administrator to include machine-wide entries"
+        self.count_label.setText(text)
 
     def _on_selection(self):
         rows = self.table.selectionModel().selectedRows()
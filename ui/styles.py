@@ -303,6 +303,49 @@ QLabel#successLabel {
     color: #a6e3a1;
 }
 
+QLabel#tierLabel {
+    font-weight: bold;
+    font-size: 14px;
+}
+
+QLabel#tierLabel[tier="green"] {
+    color: #4CAF50;
+}
+
+QLabel#tierLabel[tier="yellow"] {
+    color: #FF9800;
+}
+
+QLabel#tierLabel[tier="red"] {
+    color: #F44336;
+}
+
+QGroupBox[tier="yellow"] {
+    border-color: #FF9800;
+}
+
+QGroupBox[tier="red"] {
+    border-color: #F44336;
+}
+
+QLabel#warnRed {
+    color: #f38ba8;
+    font-size: 13px;
+}
+
+QLabel#warnOrange, QLabel#respawnHeader {
+    color: #fab387;
+}
+
+QLabel#warnSmall {
+    color: #fab387;
+    font-size: 11px;
+}
+
+QCheckBox#overrideCheck {
+    color: #f38ba8;
+}
+
 QFrame#separator {
     background-color: #313244;
     max-height: 1px;
@@ -567,6 +610,49 @@ QLabel#successLabel {
     color: #40a02b;
 }
 
+QLabel#tierLabel {
+    font-weight: bold;
+    font-size: 14px;
+}
+
+QLabel#tierLabel[tier="green"] {
+    color: #4CAF50;
+}
+
+QLabel#tierLabel[tier="yellow"] {
+    color: #FF9800;
+}
+
+QLabel#tierLabel[tier="red"] {
+    color: #F44336;
+}
+
+QGroupBox[tier="yellow"] {
+    border-color: #FF9800;
+}
+
+QGroupBox[tier="red"] {
+    border-color: #F44336;
+}
+
+QLabel#warnRed {
+    color: #d20f39;
+    font-size: 13px;
+}
+
+QLabel#warnOrange, QLabel#respawnHeader {
+    color: #df8e1d;
+}
+
+QLabel#warnSmall {
+    color: #df8e1d;
+    font-size: 11px;
+}
+
+QCheckBox#overrideCheck {
+    color: #d20f39;
+}
+
 QFrame#separator {
     background-color: #ccd0da;
     max-height: 1px;
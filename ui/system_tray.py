@@ -13,6 +13,7 @@ class SystemTrayIcon(QSystemTrayIcon):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_stats: tuple[int, int, int] = (-1, -1, -1)
         self._create_menu()
         self._update_icon(0)
         self.setToolTip("Enhanced Task Manager")
@@ -45,12 +46,18 @@ class SystemTrayIcon(QSystemTrayIcon):
         self.setContextMenu(menu)
 
     def update_stats(self, cpu: float, mem: float, disk: float):
-        """Update tray icon and menu with current stats."""
-        self._update_icon(cpu)
-        self.cpu_action.setText(f"CPU: {cpu:.0f}%")
-        self.mem_action.setText(f"RAM: {mem:.0f}%")
-        self.disk_action.setText(f"Disk: {disk:.0f}%")
-        self.setToolTip(f"CPU: {cpu:.0f}%  |  RAM: {mem:.0f}%  |  Disk: {disk:.0f}%")
+        """Update tray icon and menu with current stats, skipping unchanged values."""
+        stats = (round(cpu), round(mem), round(disk))
+        if stats == self._last_stats:
+            return
+        cpu, mem, disk = stats
+        if cpu != self._last_stats[0]:
+            self._update_icon(cpu)
+        self._last_stats = stats
+        self.cpu_action.setText(f"CPU: {cpu}%")
+        self.mem_action.setText(f"RAM: {mem}%")
+        self.disk_action.setText(f"Disk: {disk}%")
+        self.setToolTip(f"CPU: {cpu}%  |  RAM: {mem}%  |  Disk: {disk}%")
 
     def _update_icon(self, cpu_percent: float):
         """Generate a tray icon showing CPU usage as a colored bar."""